@@ -9,8 +9,10 @@ from ._native import qc as _qc_native
 
 __all__ = [
     "simhash64",
+    "simhash64_batch",
     "minhash_signature_for_text",
     "minhash_signature_with_coeffs",
+    "minhash_signatures_batch",
 ]
 
 _PRIME32 = 4294967311
@@ -18,6 +20,8 @@ _MINHASH_SEED = 0x5EED5EED
 _MINHASH_MAX_PERMS = 8192
 _MINHASH_RNG = random.Random(_MINHASH_SEED)
 _MINHASH_COEFS: list[tuple[int, int]] = []
+# Immutable per-n_perm prefixes of _MINHASH_COEFS, built once and reused across calls.
+_MINHASH_COEF_VIEWS: dict[int, tuple[tuple[int, int], ...]] = {}
 _MINHASH_LOCK = threading.Lock()
 _MAX_I64 = (1 << 63) - 1
 _MIN_I64 = -(1 << 63)
@@ -33,25 +37,26 @@ def _clamp_i64(value: int | None) -> int | None:
     return value
 
 
-def _minhash_coeffs(n_perm: int) -> list[tuple[int, int]]:
+def _minhash_coeffs(n_perm: int) -> tuple[tuple[int, int], ...]:
     """Return deterministic MinHash coefficients for a given permutation count."""
+    view = _MINHASH_COEF_VIEWS.get(n_perm)
+    if view is not None:
+        return view
     if n_perm < 0:
         raise ValueError(f"n_perm must be non-negative; got {n_perm!r}.")
     if n_perm > _MINHASH_MAX_PERMS:
         raise ValueError(
             f"n_perm must be <= {_MINHASH_MAX_PERMS}; got {n_perm!r}."
         )
-    if n_perm == 0:
-        return []
-    if len(_MINHASH_COEFS) < n_perm:
-        # Guard RNG/cache mutation so concurrent callers can't interleave coefficients.
-        with _MINHASH_LOCK:
-            if len(_MINHASH_COEFS) < n_perm:
-                for _ in range(len(_MINHASH_COEFS), n_perm):
-                    a = _MINHASH_RNG.randrange(1, _PRIME32 - 1)
-                    b = _MINHASH_RNG.randrange(0, _PRIME32 - 1)
-                    _MINHASH_COEFS.append((a, b))
-    return _MINHASH_COEFS[:n_perm]
+    # Guard RNG/cache mutation so concurrent callers can't interleave coefficients.
+    with _MINHASH_LOCK:
+        if len(_MINHASH_COEFS) < n_perm:
+            for _ in range(len(_MINHASH_COEFS), n_perm):
+                a = _MINHASH_RNG.randrange(1, _PRIME32 - 1)
+                b = _MINHASH_RNG.randrange(0, _PRIME32 - 1)
+                _MINHASH_COEFS.append((a, b))
+        view = _MINHASH_COEF_VIEWS.setdefault(n_perm, tuple(_MINHASH_COEFS[:n_perm]))
+    return view
 
 
 def simhash64(text: str, *, max_tokens: int | None = None) -> int:
@@ -60,6 +65,16 @@ def simhash64(text: str, *, max_tokens: int | None = None) -> int:
     return int(_qc_native.simhash64(text, max_tokens))
 
 
+def simhash64_batch(
+    texts: Sequence[str],
+    *,
+    max_tokens: int | None = None,
+) -> list[int]:
+    """Compute Simhash fingerprints for many texts in one native call."""
+    max_tokens = _clamp_i64(max_tokens)
+    return _qc_native.simhash64_batch(list(texts), max_tokens)
+
+
 def minhash_signature_with_coeffs(
     text: str,
     *,
@@ -77,10 +92,10 @@ def minhash_signature_with_coeffs(
     sig = _qc_native.minhash_signature_with_coeffs(
         text,
         k,
-        list(coeffs),
+        coeffs,
         max_shingles,
     )
-    return tuple(int(val) for val in sig)
+    return tuple(sig)
 
 
 def minhash_signature_for_text(
@@ -99,3 +114,26 @@ def minhash_signature_for_text(
         max_shingles=max_shingles,
         coeffs=coeffs,
     )
+
+
+def minhash_signatures_batch(
+    texts: Sequence[str],
+    *,
+    k: int,
+    n_perm: int,
+    max_shingles: int | None = None,
+) -> list[tuple[int, ...]]:
+    """Build MinHash signatures for many texts in one native call.
+
+    Uses the same deterministic coefficients as ``minhash_signature_for_text``;
+    the GIL is released once for the whole batch.
+    """
+    coeffs = _minhash_coeffs(n_perm)
+    max_shingles = _clamp_i64(max_shingles)
+    sigs = _qc_native.minhash_signatures_batch_with_coeffs(
+        list(texts),
+        k,
+        coeffs,
+        max_shingles,
+    )
+    return [tuple(sig) for sig in sigs]
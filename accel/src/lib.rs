@@ -7,6 +7,8 @@ const DEFAULT_SIMHASH_MAX_TOKENS: usize = 20000;
 const DEFAULT_MINHASH_MAX_SHINGLES: usize = 20000;
 const PRIME32: u64 = 4294967311;
 const MINHASH_SENTINEL: u64 = PRIME32;
+// 15 * hi <= 15 * (PRIME32 - 1) when a, b < PRIME32 and x < 2^32.
+const REDUCE_BIAS: u64 = 15 * PRIME32;
 const ADLER_MOD: u32 = 65521;
 
 #[derive(Debug)]
@@ -189,6 +191,81 @@ fn adler32(data: &[u8]) -> u32 {
     (s2 << 16) | s1
 }
 
+/// Compute `(a * x + b) mod PRIME32` without a 128-bit division.
+///
+/// PRIME32 is `2^32 + 15`, so `2^32 == -15 (mod PRIME32)`. Splitting the product into
+/// `hi * 2^32 + lo` gives `lo - 15 * hi`; adding `REDUCE_BIAS` keeps it non-negative and
+/// leaves a u64 remainder by a constant, which compiles to a multiply instead of a divide.
+#[inline(always)]
+fn perm_hash(a: u64, b: u64, x: u64) -> u64 {
+    let t = u128::from(a) * u128::from(x) + u128::from(b);
+    let hi = (t >> 32) as u64;
+    let lo = (t as u64) & 0xFFFF_FFFF;
+    (lo + REDUCE_BIAS - 15 * hi) % PRIME32
+}
+
+/// Split `(a, b)` pairs into contiguous lanes, reduced so perm_hash's bounds hold.
+fn split_coeffs(coeffs: &[(u64, u64)]) -> (Vec<u64>, Vec<u64>) {
+    let a_vec = coeffs.iter().map(|(a, _)| *a % PRIME32).collect();
+    let b_vec = coeffs.iter().map(|(_, b)| *b % PRIME32).collect();
+    (a_vec, b_vec)
+}
+
+/// MinHash kernel shared by the single-text and batch entry points.
+fn minhash_signature_impl(
+    text: &str,
+    k: usize,
+    a_vec: &[u64],
+    b_vec: &[u64],
+    max_shingles: Option<usize>,
+) -> Vec<u64> {
+    if k == 0 {
+        return vec![MINHASH_SENTINEL; a_vec.len()];
+    }
+
+    let mut bytes = text.as_bytes();
+    if bytes.len() < k {
+        return vec![MINHASH_SENTINEL; a_vec.len()];
+    }
+
+    if let Some(limit) = max_shingles {
+        let byte_limit = limit.saturating_add(k.saturating_sub(1));
+        if bytes.len() > byte_limit {
+            bytes = &bytes[..byte_limit];
+        }
+    }
+
+    let mut shingles = std::collections::HashSet::new();
+    if bytes.len() >= k {
+        for i in 0..=bytes.len() - k {
+            let gram = &bytes[i..i + k];
+            if !gram.iter().any(|&c| c > 32) {
+                continue;
+            }
+            shingles.insert(adler32(gram));
+        }
+    }
+
+    if shingles.is_empty() {
+        return vec![MINHASH_SENTINEL; a_vec.len()];
+    }
+
+    // Contiguous a/b lanes keep the per-permutation min update a straight-line loop
+    // over slices the compiler can unroll and vectorize.
+    let mut sig = vec![MINHASH_SENTINEL; a_vec.len()];
+    for x in shingles {
+        let x64 = u64::from(x);
+        for ((slot, a), b) in sig.iter_mut().zip(a_vec).zip(b_vec) {
+            let v = perm_hash(*a, *b, x64);
+            if v < *slot {
+                *slot = v;
+            }
+        }
+    }
+
+    sig
+}
+
 #[pyfunction]
 #[pyo3(signature = (text, k, coeffs, max_shingles=None))]
 fn minhash_signature_with_coeffs(
@@ -201,51 +278,41 @@ fn minhash_signature_with_coeffs(
     let text_owned = text.to_owned();
     let max_shingles = normalize_max_shingles(max_shingles);
     let result = py.allow_threads(|| {
-        if k == 0 {
-            return vec![MINHASH_SENTINEL; coeffs.len()];
-        }
-
-        let mut bytes = text_owned.as_bytes();
-        if bytes.len() < k {
-            return vec![MINHASH_SENTINEL; coeffs.len()];
-        }
-
-        if let Some(limit) = max_shingles {
-            let byte_limit = limit.saturating_add(k.saturating_sub(1));
-            if bytes.len() > byte_limit {
-                bytes = &bytes[..byte_limit];
-            }
-        }
-
-        let mut shingles = std::collections::HashSet::new();
-        if bytes.len() >= k {
-            for i in 0..=bytes.len() - k {
-                let gram = &bytes[i..i + k];
-                if !gram.iter().any(|&c| c > 32) {
-                    continue;
-                }
-                shingles.insert(adler32(gram));
-            }
-        }
-
-        if shingles.is_empty() {
-            return vec![MINHASH_SENTINEL; coeffs.len()];
-        }
+        let (a_vec, b_vec) = split_coeffs(&coeffs);
+        minhash_signature_impl(&text_owned, k, &a_vec, &b_vec, max_shingles)
+    });
+    Ok(result)
+}
 
-        let mut sig = vec![MINHASH_SENTINEL; coeffs.len()];
-        for x in shingles {
-            let x64 = x as u64;
-            for (idx, (a, b)) in coeffs.iter().enumerate() {
-                let v = ((u128::from(*a) * u128::from(x64)) + u128::from(*b))
-                    % u128::from(PRIME32);
-                let v = v as u64;
-                if v < sig[idx] {
-                    sig[idx] = v;
-                }
-            }
-        }
+#[pyfunction]
+#[pyo3(signature = (texts, max_tokens=None))]
+fn simhash64_batch(py: Python, texts: Vec<String>, max_tokens: Option<i64>) -> PyResult<Vec<u64>> {
+    let limit = normalize_max_tokens(max_tokens);
+    let result = py.allow_threads(|| {
+        texts
+            .iter()
+            .map(|text| simhash64_impl(text, limit))
+            .collect::<Result<Vec<u64>, HashError>>()
+    });
+    result.map_err(|err| PyRuntimeError::new_err(err.to_string()))
+}
 
-        sig
+#[pyfunction]
+#[pyo3(signature = (texts, k, coeffs, max_shingles=None))]
+fn minhash_signatures_batch_with_coeffs(
+    py: Python,
+    texts: Vec<String>,
+    k: usize,
+    coeffs: Vec<(u64, u64)>,
+    max_shingles: Option<i64>,
+) -> PyResult<Vec<Vec<u64>>> {
+    let max_shingles = normalize_max_shingles(max_shingles);
+    let result = py.allow_threads(|| {
+        let (a_vec, b_vec) = split_coeffs(&coeffs);
+        texts
+            .iter()
+            .map(|text| minhash_signature_impl(text, k, &a_vec, &b_vec, max_shingles))
+            .collect::<Vec<Vec<u64>>>()
     });
     Ok(result)
 }
@@ -255,6 +322,8 @@ fn _native(py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
     let qc = PyModule::new(py, "qc")?;
     qc.add_function(wrap_pyfunction!(simhash64, &qc)?)?;
     qc.add_function(wrap_pyfunction!(minhash_signature_with_coeffs, &qc)?)?;
+    qc.add_function(wrap_pyfunction!(simhash64_batch, &qc)?)?;
+    qc.add_function(wrap_pyfunction!(minhash_signatures_batch_with_coeffs, &qc)?)?;
     m.add_submodule(&qc)?;
     Ok(())
 }
@@ -189,7 +189,7 @@ except Exception:  # pragma: no cover - keep import errors silent
     pass
 
 try:  # pragma: no cover - optional dependency
-    from .sources.pdfio import extract_pdf_records
+    from .sources.pdfio import extract_pdf_records, iter_pdf_records
 except Exception:  # pragma: no cover
     pass
 
@@ -13,12 +13,15 @@ from ..core.config import SievioConfig, SinkSpec, SourceSpec
 from ..core.factories_context import make_repo_context_from_git
 from ..core.factories_sinks import make_output_paths_for_github, make_output_paths_for_pdf
 from ..core.interfaces import RepoContext
-from ..core.licenses import apply_license_to_context, detect_license_in_tree
+from ..core.licenses import apply_license_to_context, detect_license_in_tree, detect_license_in_zip
 from ..core.log import get_logger
 from ..core.pipeline import PipelineEngine
+from ..core.safe_http import SafeHttpClient
 from ..sources.githubio import (
+    GitHubZipSource,
     RepoSpec,
     detect_license_for_github_repo,
+    download_zipball_to_temp,
     get_repo_info,
     parse_github_url,
 )
@@ -38,16 +41,25 @@ class GitHubRepoProfile:
         spec (RepoSpec): Parsed GitHub repository specification including
             owner, repo, and optional ref.
         ref (str): Git reference (branch, tag, or commit) resolved for
-            this run.
+            this run, falling back to ``"main"`` for naming when neither
+            the URL nor the GitHub API supplied one.
         license_spdx (str | None): Detected SPDX license identifier or
             expression, if available.
         ctx (RepoContext): Repository context carrying repo-level
             metadata, including license, URL, and optional commit SHA.
+        source_ref (str | None): Ref taken from the URL or the API's
+            default branch, or None when it could not be resolved. Only
+            this ref is pinned on the source spec.
+        zip_path (str | None): Zipball downloaded for license detection
+            and kept for the conversion, if requested. The caller that
+            asked for it is responsible for removing the file.
     """
     spec: RepoSpec
     ref: str
     license_spdx: str | None
     ctx: RepoContext
+    source_ref: str | None = None
+    zip_path: str | None = None
 
 
 
@@ -108,10 +120,18 @@ def _clone_base_config(base_config: SievioConfig | None) -> SievioConfig:
     return replace(base_config) if base_config is not None else SievioConfig()
 
 
+def _http_client_for(cfg: SievioConfig) -> SafeHttpClient:
+    """Build a client from ``cfg.http`` without storing it on the spec."""
+    return replace(cfg.http).build_client()
+
+
 def _build_github_repo_profile(
     url: str,
     *,
     base_context: RepoContext | None = None,
+    keep_zip: bool = False,
+    http_client: SafeHttpClient | None = None,
+    download_timeout: float | None = None,
 ) -> GitHubRepoProfile:
     """Build a GitHub repository profile from a URL.
 
@@ -123,6 +143,13 @@ def _build_github_repo_profile(
         url (str): GitHub repository URL (optionally including a ref).
         base_context (RepoContext | None): Optional starting context to
             extend with GitHub metadata.
+        keep_zip (bool): Keep the zipball downloaded for license
+            detection and return its path on the profile so the same
+            call chain can convert it without downloading again.
+        http_client (SafeHttpClient | None): Client for the API lookup and
+            zipball download; defaults to the global client.
+        download_timeout (float | None): Zipball download timeout; defaults
+            to the download helper's own timeout.
 
     Returns:
         GitHubRepoProfile: Profile containing spec, ref, license, and
@@ -136,15 +163,29 @@ def _build_github_repo_profile(
         raise ValueError(f"Invalid GitHub URL: {url!r}")
     info: dict[str, Any] | None = None
     try:
-        info = get_repo_info(spec)
+        info = get_repo_info(spec, client=http_client)
     except Exception:
         info = None
-    ref = spec.ref or ((info or {}).get("default_branch")) or "main"
-    detected_license: str | None
-    try:
-        detected_license = detect_license_for_github_repo(spec, ref=ref)
-    except Exception:
-        detected_license = None
+    source_ref = spec.ref or (info or {}).get("default_branch") or None
+    ref = source_ref or "main"
+    detected_license: str | None = None
+    zip_path: str | None = None
+    timeout_kwargs = {} if download_timeout is None else {"timeout": download_timeout}
+    if keep_zip:
+        try:
+            zip_path = download_zipball_to_temp(
+                spec, ref=source_ref, client=http_client, **timeout_kwargs
+            )
+            detected_license, _meta = detect_license_in_zip(zip_path, spec.subpath)
+        except Exception as exc:
+            log.debug("GitHub license detection failed for %s: %s", spec.full_name, exc)
+    else:
+        try:
+            detected_license = detect_license_for_github_repo(
+                spec, ref=source_ref, client=http_client, **timeout_kwargs
+            )
+        except Exception:
+            detected_license = None
     api_license = (info or {}).get("license_spdx")
     license_spdx = detected_license or api_license
     ctx = base_context
@@ -164,7 +205,14 @@ def _build_github_repo_profile(
             commit_sha=ctx.commit_sha,
             extra=ctx.extra,
         )
-    return GitHubRepoProfile(spec=spec, ref=ref, license_spdx=license_spdx, ctx=ctx)
+    return GitHubRepoProfile(
+        spec=spec,
+        ref=ref,
+        license_spdx=license_spdx,
+        ctx=ctx,
+        source_ref=source_ref,
+        zip_path=zip_path,
+    )
 
 
 # ---------- Path helpers ----------
@@ -282,8 +330,10 @@ def convert_github(
 ) -> dict[str, object]:
     """Convert a GitHub repository into a dataset.
 
-    Builds a ``SievioConfig`` for a GitHub repository via
-    ``make_github_profile`` and runs the engine via ``convert``.
+    Builds a ``SievioConfig`` for a GitHub repository the same way as
+    ``make_github_profile`` and runs the engine via ``convert``. The
+    zipball downloaded for license detection is reused for the
+    conversion and removed afterwards.
 
     Args:
         url (str): GitHub repository URL.
@@ -296,13 +346,31 @@ def convert_github(
     Returns:
         Dict[str, object]: Aggregate statistics for the completed run.
     """
-    cfg = make_github_profile(
+    cfg = _clone_base_config(base_config)
+    http_client = _http_client_for(cfg)
+    # Keep the zipball fetched for license detection so the conversion reads
+    # the same file instead of downloading the repository a second time.
+    profile = _build_github_repo_profile(
         url,
-        out_jsonl,
-        out_prompt=out_prompt,
-        base_config=base_config,
+        base_context=cfg.sinks.context,
+        keep_zip=True,
+        http_client=http_client,
+        download_timeout=cfg.http.timeout,
     )
-    return convert(cfg)
+    try:
+        _apply_github_profile(cfg, url, profile, out_jsonl, out_prompt=out_prompt)
+        engine = build_engine(cfg, overrides=PipelineOverrides(http_client=http_client))
+        if profile.zip_path:
+            for source in engine.plan.runtime.sources:
+                if isinstance(source, GitHubZipSource):
+                    source.use_existing_zip(profile.zip_path)
+        return run_engine(engine)
+    finally:
+        if profile.zip_path:
+            try:
+                os.remove(profile.zip_path)
+            except OSError as exc:
+                log.debug("temp zip cleanup failed for %s: %s", profile.zip_path, exc)
 
 
 def make_local_repo_config(
@@ -461,11 +529,35 @@ def make_github_profile(
     """
     cfg = _clone_base_config(base_config)
     base_ctx = repo_context or cfg.sinks.context
-    profile = _build_github_repo_profile(url, base_context=base_ctx)
+    profile = _build_github_repo_profile(
+        url,
+        base_context=base_ctx,
+        http_client=_http_client_for(cfg),
+        download_timeout=cfg.http.timeout,
+    )
+    _apply_github_profile(cfg, url, profile, out_jsonl, out_prompt=out_prompt)
+    return cfg
+
+
+def _apply_github_profile(
+    cfg: SievioConfig,
+    url: str,
+    profile: GitHubRepoProfile,
+    out_jsonl: str | Path,
+    *,
+    out_prompt: str | Path | None = None,
+) -> None:
+    """Wire GitHub source/sink specs and metadata from a built profile."""
     ctx = profile.ctx
     cfg.sinks.context = ctx
+    # Pass the ref resolved for the profile so the source does not repeat the
+    # default-branch lookup. An unresolved ref is left to the source rather
+    # than pinned to "main".
+    source_opts: dict[str, Any] = {"url": url}
+    if profile.source_ref:
+        source_opts["ref"] = profile.source_ref
     cfg.sources.specs = [
-        SourceSpec(kind="github_zip", options={"url": url}),
+        SourceSpec(kind="github_zip", options=source_opts),
     ]
     cfg.sinks.specs = [
         SinkSpec(
@@ -485,4 +577,3 @@ def make_github_profile(
     cfg.metadata.primary_jsonl = str(out_jsonl)
     if out_prompt is not None:
         cfg.metadata.prompt_path = str(out_prompt)
-    return cfg
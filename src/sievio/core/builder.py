@@ -12,8 +12,9 @@ from __future__ import annotations
 from collections.abc import Callable, Iterable, Sequence
 from copy import deepcopy
 from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, TypeAlias
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeAlias
 
 from .chunk import ChunkPolicy
 from .concurrency import resolve_pipeline_executor_config
@@ -139,7 +140,7 @@ FileMiddlewareLike: TypeAlias = (
 )
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class PipelineRuntime:
     """Hold resolved runtime wiring and state for a pipeline run.
 
@@ -194,7 +195,15 @@ class PipelineRuntime:
     code_language_detector: CodeLanguageDetector | None = None
 
 
-@dataclass(slots=True)
+class _ExecutorInputs(NamedTuple):
+    """Runtime components consulted by resolve_pipeline_executor_config()."""
+
+    sources: Sequence[Source]
+    bytes_handlers: Sequence[tuple[Sniff, BytesHandler]]
+    file_extractor: FileExtractor
+
+
+@dataclass(slots=True, frozen=True)
 class SinksPreparationResult:
     """Bundle sink instances with normalized sink config and metadata.
 
@@ -211,7 +220,7 @@ class SinksPreparationResult:
     metadata: RunMetadata
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class PipelinePreparationResult:
     """Bundle bytes handlers and file extractor for the pipeline.
 
@@ -225,7 +234,7 @@ class PipelinePreparationResult:
     file_extractor: FileExtractor
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class QCPreparationResult:
     """Bundle normalized QC configuration and screening hooks.
 
@@ -248,7 +257,7 @@ class QCPreparationResult:
     post_safety_scorer: SafetyScorer | None
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class PipelinePlan:
     """Represent an immutable plan derived from a SievioConfig.
 
@@ -300,7 +309,8 @@ def build_pipeline_plan(
         registries (RegistryBundle | None): Bundle of registries for
             sources, sinks, bytes handlers, and QC scorers. When
             omitted, :func:`default_registries` is used with
-            ``load_plugins``.
+            ``load_plugins`` and cached across calls (see
+            :func:`invalidate_registry_cache`).
         source_registry (SourceRegistry | None): Registry override used
             to build sources. Overrides ``registries.sources`` when
             provided.
@@ -338,7 +348,7 @@ def build_pipeline_plan(
     cfg = config if mutate else deepcopy(config)
     _assert_runtime_free_spec(cfg)
     cfg.logging.apply()
-    bundle = registries or default_registries(load_plugins=load_plugins)
+    bundle = registries or _default_registry_bundle(load_plugins)
     source_registry = source_registry or bundle.sources
     sink_registry = sink_registry or bundle.sinks
     bytes_registry = bytes_registry or bundle.bytes
@@ -375,37 +385,69 @@ def build_pipeline_plan(
     _attach_run_header_record(cfg, sinks_res.sinks)
     cfg.validate()
 
-    lifecycle_hooks: list[RunLifecycleHook] = list(qc_res.hooks)
-    lifecycle_hooks.append(RunSummaryHook())
+    lifecycle_hooks: tuple[RunLifecycleHook, ...] = (*qc_res.hooks, RunSummaryHook())
     dc_cfg = getattr(cfg, "dataset_card", None)
     # Default to enabled when config is missing, but respect an explicit flag.
     card_enabled = True if dc_cfg is None else getattr(dc_cfg, "enabled", True)
 
     if card_enabled:
-        lifecycle_hooks.append(DatasetCardHook(enabled=card_enabled))
+        lifecycle_hooks += (DatasetCardHook(enabled=card_enabled),)
 
     bytes_handlers = pipe_res.bytes_handlers
     file_extractor = pipe_res.file_extractor
-    temp_runtime = PipelineRuntime(
+    # Executor inference only inspects these components, so resolve it
+    # before building the runtime and construct PipelineRuntime once.
+    exec_cfg, fail_fast = resolve_pipeline_executor_config(
+        cfg,
+        runtime=_ExecutorInputs(sources, bytes_handlers, file_extractor),
+    )
+    runtime = PipelineRuntime(
         http_client=http_client,
         sources=sources,
         sinks=sinks_res.sinks,
         file_extractor=file_extractor,
         bytes_handlers=bytes_handlers,
         record_middlewares=tuple(middlewares),
-        lifecycle_hooks=tuple(lifecycle_hooks),
+        lifecycle_hooks=lifecycle_hooks,
+        executor_config=exec_cfg,
+        fail_fast=fail_fast,
         qc_scorer_for_csv=qc_res.scorer_for_csv,
         post_qc_scorer=qc_res.post_qc_scorer,
         post_safety_scorer=qc_res.post_safety_scorer,
         language_detector=lang_det,
         code_language_detector=code_lang_det,
     )
-    exec_cfg, fail_fast = resolve_pipeline_executor_config(cfg, runtime=temp_runtime)
-    runtime = replace(temp_runtime, executor_config=exec_cfg, fail_fast=fail_fast)
     _strip_runtime_from_spec(cfg)
     return PipelinePlan(spec=cfg, runtime=runtime)
 
 
+@lru_cache(maxsize=2)
+def _cached_default_registries(load_plugins: bool) -> RegistryBundle:
+    """Return the default registry bundle, scanning entry points only once."""
+    return default_registries(load_plugins=load_plugins)
+
+
+def _default_registry_bundle(load_plugins: bool) -> RegistryBundle:
+    """Return the cached default bundle with per-call source and sink registries.
+
+    Registering into the returned source or sink registry does not affect
+    later plans. The bytes and scorer registries are the process-wide shared
+    instances either way.
+    """
+    cached = _cached_default_registries(load_plugins)
+    return replace(cached, sources=cached.sources.copy(), sinks=cached.sinks.copy())
+
+
+def invalidate_registry_cache() -> None:
+    """Drop the cached default registries so plugins are rediscovered.
+
+    build_pipeline_plan() reuses the default bundle across calls when no
+    ``registries`` are supplied. Call this after installing plugins at
+    runtime or between tests that patch plugin discovery.
+    """
+    _cached_default_registries.cache_clear()
+
+
 def _prepare_http(
     cfg: SievioConfig,
     overrides: PipelineOverrides | None = None,
@@ -443,37 +485,37 @@ def _assert_runtime_free_spec(cfg: SievioConfig) -> None:
     Raises:
         ValueError: If any runtime-only field is populated.
     """
-    if getattr(cfg.sources, "sources", None):
+    if cfg.sources.sources:
         raise ValueError(
             "sources.sources must be empty in declarative specs; "
             "provide declarative specs instead."
         )
-    if getattr(cfg.sinks, "sinks", None):
+    if cfg.sinks.sinks:
         raise ValueError(
             "sinks.sinks must be empty in declarative specs; "
             "provide declarative specs instead."
         )
-    if getattr(cfg.http, "client", None) is not None:
+    if cfg.http.client is not None:
         raise ValueError(
             "http.client must be unset in declarative specs; "
             "provide HTTP client via runtime wiring or PipelineOverrides.http_client."
         )
-    if getattr(cfg.qc, "scorer", None) is not None:
+    if cfg.qc.scorer is not None:
         raise ValueError(
             "qc.scorer must be unset in declarative specs; "
             "use QC registry/plugins or PipelineOverrides.qc_scorer instead."
         )
-    if getattr(cfg.pipeline, "file_extractor", None) is not None:
+    if cfg.pipeline.file_extractor is not None:
         raise ValueError(
             "pipeline.file_extractor must be unset in declarative specs; "
             "register extractors or use PipelineOverrides.file_extractor instead."
         )
-    if getattr(cfg.pipeline, "extractors", None):
+    if cfg.pipeline.extractors:
         raise ValueError(
             "pipeline.extractors must be empty in declarative specs; "
             "register extractors via runtime wiring instead."
         )
-    if getattr(cfg.pipeline, "bytes_handlers", None):
+    if cfg.pipeline.bytes_handlers:
         raise ValueError(
             "pipeline.bytes_handlers must be empty in declarative specs; "
             "use registries/plugins or PipelineOverrides.bytes_handlers instead."
@@ -538,31 +580,28 @@ def _prepare_sinks(
             "sinks.sinks must be empty in specs; "
             "provide declarative specs instead."
         )
-    sinks_cfg = replace(cfg.sinks, sinks=tuple())
+    base_cfg = cfg.sinks
     metadata = cfg.metadata
     runtime_sinks: tuple[Sink, ...] = ()
 
     if cfg.sinks.specs:
         sinks, extra_meta, final_ctx = registry.build_all(ctx, cfg.sinks.specs)
         runtime_sinks = tuple(sinks)
-        sinks_cfg = replace(final_ctx.sink_config, sinks=tuple())
+        base_cfg = final_ctx.sink_config
         metadata = metadata.merged(extra_meta)
 
-    primary = sinks_cfg.primary_jsonl_name or metadata.primary_jsonl
+    # Collect every normalized field so the SinkConfig is rebuilt only once.
+    changes: dict[str, Any] = {"sinks": ()}
+    primary = base_cfg.primary_jsonl_name or metadata.primary_jsonl
     if primary:
         primary_str = str(primary)
-        sinks_cfg = replace(sinks_cfg, primary_jsonl_name=primary_str)
+        changes["primary_jsonl_name"] = primary_str
         metadata = metadata.merged({"primary_jsonl": primary_str})
 
-        output_dir = sinks_cfg.output_dir
-        needs_output_dir = output_dir is None or str(output_dir) in {"", "."}
-        if needs_output_dir:
-            try:
-                parent = Path(primary_str).parent
-            except Exception:
-                parent = None
-            if parent:
-                sinks_cfg = replace(sinks_cfg, output_dir=parent)
+        output_dir = base_cfg.output_dir
+        if output_dir is None or str(output_dir) in {"", "."}:
+            changes["output_dir"] = Path(primary_str).parent
+    sinks_cfg = replace(base_cfg, **changes)
 
     return SinksPreparationResult(
         sinks=runtime_sinks,
@@ -597,7 +636,7 @@ def _prepare_pipeline(
     if overrides and overrides.bytes_handlers is not None:
         bytes_handlers = tuple(overrides.bytes_handlers)
     else:
-        bytes_handlers = tuple(make_bytes_handlers(bytes_registry))
+        bytes_handlers = make_bytes_handlers(bytes_registry)
 
     if overrides and overrides.file_extractor is not None:
         file_extractor = overrides.file_extractor
@@ -687,7 +726,7 @@ def _prepare_qc(
             safety_cfg.scorer = None
         return QCPreparationResult(
             qc_cfg=qc_cfg,
-            hooks=tuple(),
+            hooks=(),
             scorer_for_csv=None,
             post_qc_scorer=None,
             post_safety_scorer=None,
@@ -870,11 +909,18 @@ def _attach_run_header_record(cfg: SievioConfig, sinks: Sequence[Sink]) -> None:
         sinks (Sequence[Sink]): Runtime sinks that may accept header
             records.
     """
+    setters = [
+        setter
+        for setter in (getattr(sink, "set_header_record", None) for sink in sinks)
+        if callable(setter)
+    ]
+    if not setters:
+        # Serializing the whole config is the expensive part; skip it when
+        # no sink will receive the header.
+        return
     header = build_run_header_record(cfg)
-    for sink in sinks:
-        setter = getattr(sink, "set_header_record", None)
-        if callable(setter):
-            setter(header)
+    for setter in setters:
+        setter(header)
 
 
 def _strip_runtime_from_spec(cfg: SievioConfig) -> None:
@@ -78,6 +78,10 @@ def _get_tokenizer(tokenizer_name: str | None = None):
 
 
 _PUNCT = set("()[]{}<>=:+-*/%,.;$#@\\|`~^")
+# bytes.translate table for ASCII text: punctuation -> 1, digits -> 2, else 0.
+_ASCII_CLASSES = bytes(
+    1 if chr(b) in _PUNCT else 2 if chr(b).isdigit() else 0 for b in range(128)
+) + bytes(128)
 
 
 def _char_token_ratio(text: str,kind: str) -> float:
@@ -98,8 +102,14 @@ def _char_token_ratio(text: str,kind: str) -> float:
     n = len(text)
     if n == 0:
         return 4.0
-    sym = sum(1 for ch in text if ch in _PUNCT)
-    digits = sum(1 for ch in text if ch.isdigit())
+    if text.isascii():
+        # Classify in one C-level pass instead of a Python loop per character.
+        classes = text.encode("ascii").translate(_ASCII_CLASSES)
+        sym = classes.count(1)
+        digits = classes.count(2)
+    else:
+        sym = sum(map(text.count, _PUNCT))
+        digits = sum(1 for ch in text if ch.isdigit())
     spaces = text.count(" ") + text.count("\n") + text.count("\t")
     sym_density = (sym + digits) / max(1, n)
     base = 3.2 if kind == "code" else 4.0
@@ -123,7 +133,6 @@ def count_tokens(text: str, tokenizer=None, mode: str="auto") -> int:
     Returns:
         int: Estimated or exact token count for the given text.
     """
-    ratio = _char_token_ratio(text,mode)
     if tokenizer is None:
         tokenizer = _get_tokenizer()
     if tokenizer is None:
@@ -187,75 +196,76 @@ def _split_markdown_blocks(text: str, tokenizer) -> list[Block]:
     Returns:
         list[Block]: Sequence of blocks covering the input text.
     """
+    # Lines are contiguous in ``text``, so blocks are sliced out by offset
+    # rather than re-joined from per-line buffers. splitlines() never yields
+    # empty lines, so ``line.isspace()`` is the blank-line test.
     lines = text.splitlines(keepends=True)
     n = len(lines)
     i = 0
     pos = 0
     out: list[Block] = []
-    buf: list[str] = []
-    bstart = 0
+    bstart: int | None = None
 
     def flush():
-        nonlocal buf, bstart
-        if buf:
-            block_text = "".join(buf)
+        nonlocal bstart
+        if bstart is not None:
+            block_text = text[bstart:pos]
             tokens = count_tokens(block_text, tokenizer, "doc")
-            out.append(Block(block_text, bstart, bstart + len(block_text), tokens, kind="text"))
-            buf = []
+            out.append(Block(block_text, bstart, pos, tokens, kind="text"))
+            bstart = None
 
     while i < n:
         line = lines[i]
         ln = len(line)
 
+        # Block markers must start within the first four columns, so a
+        # substring test on that prefix skips the regexes for most lines.
+        head = line[:4]
+
         # Fenced code block
-        match = _FENCE_START.match(line)
+        match = _FENCE_START.match(line) if ("`" in head or "~" in head) else None
         if match:
             flush()
             start = pos
             fence = match.group(1)  # full run of backticks/tilde
             fence_char = fence[0]
             fence_len = len(fence)
-            buf2 = [line]
             pos += ln
             i += 1
             while i < n:
                 cur = lines[i]
-                buf2.append(cur)
                 pos += len(cur)
                 i += 1
                 close = _FENCE_CLOSE.match(cur)
                 if close and close.group(1)[0] == fence_char and len(close.group(1)) >= fence_len:
                     break
-            block_text = "".join(buf2)
+            block_text = text[start:pos]
             tokens = count_tokens(block_text, tokenizer, "code") # Fences are code
             out.append(Block(block_text, start, start + len(block_text), tokens, kind="code"))
             continue
 
         # ATX heading
-        if re.match(r'^[ \t]{0,3}#{1,6}[ \t]+\S', line):
+        if "#" in head and _ATX_HEADING.match(line):
             flush()
             tokens = count_tokens(line, tokenizer, "doc")
             out.append(Block(line, pos, pos + ln, tokens, kind="heading"))
             pos += ln
             i += 1
-            bstart = pos
             continue
 
         # Setext heading: need current line + next underline line
-        if i + 1 < n and lines[i].strip() and _SETEXT_UNDERLINE.match(lines[i + 1]):
+        if i + 1 < n and not lines[i].isspace() and _SETEXT_UNDERLINE.match(lines[i + 1]):
             flush()
             block_text = lines[i] + lines[i + 1]
             tokens = count_tokens(block_text, tokenizer, "doc")
             out.append(Block(block_text, pos, pos + len(block_text), tokens, kind="heading"))
             pos += len(block_text)
             i += 2
-            bstart = pos
             continue
 
         # Default accumulate
-        if not buf:
+        if bstart is None:
             bstart = pos
-        buf.append(line)
         pos += ln
         i += 1
 
@@ -344,16 +354,15 @@ def _split_rst_blocks(text: str, tokenizer) -> list[Block]:
     i = 0
     pos = 0
     out: list[Block] = []
-    buf: list[str] = []
-    bstart = 0
+    bstart: int | None = None
 
     def flush():
-        nonlocal buf, bstart
-        if buf:
-            block_text = "".join(buf)
+        nonlocal bstart
+        if bstart is not None:
+            block_text = text[bstart:pos]
             tokens = count_tokens(block_text, tokenizer, "doc")
-            out.append(Block(block_text, bstart, bstart + len(block_text), tokens, kind="text"))
-            buf = []
+            out.append(Block(block_text, bstart, pos, tokens, kind="text"))
+            bstart = None
 
     while i < n:
         line = lines[i]
@@ -384,13 +393,12 @@ def _split_rst_blocks(text: str, tokenizer) -> list[Block]:
                         kind="heading",
                     )
                 )
-                bstart = pos
                 continue
 
         # Title + underline
         if (
             i + 1 < n
-            and lines[i].strip()
+            and not lines[i].isspace()
             and _RST_UNDERLINE.match(lines[i + 1])
             and _underline_long_enough(lines[i + 1], lines[i])
         ):
@@ -409,7 +417,6 @@ def _split_rst_blocks(text: str, tokenizer) -> list[Block]:
                     kind="heading",
                 )
             )
-            bstart = pos
             continue
 
         # Directives: '.. name::' then optional blank and indented body
@@ -418,55 +425,47 @@ def _split_rst_blocks(text: str, tokenizer) -> list[Block]:
             flush()
             start = pos
             dir_indent = _leading_spaces(line)
-            buf2 = [line]
             pos += ln
             i += 1
             # optional blank line after directive
-            if i < n and lines[i].strip() == "":
-                buf2.append(lines[i])
+            if i < n and lines[i].isspace():
                 pos += len(lines[i])
                 i += 1
             # capture indented content (strictly more indented than directive line)
             while i < n:
                 nxt = lines[i]
-                if nxt.strip() == "":
-                    buf2.append(nxt)
+                if nxt.isspace():
                     pos += len(nxt)
                     i += 1
                     continue
                 if _leading_spaces(nxt) > dir_indent:
-                    buf2.append(nxt)
                     pos += len(nxt)
                     i += 1
                 else:
                     break
-            block_text = "".join(buf2)
+            block_text = text[start:pos]
             tokens = count_tokens(block_text, tokenizer, "doc")
             dir_name = (mdir.group(1) or "").lower()
             kind = "code" if dir_name in _RST_CODE_DIRECTIVES else "text"
             out.append(Block(block_text, start, start + len(block_text), tokens, kind=kind))
-            bstart = pos
             continue
 
         # Literal block after '::'
         if _RST_LITERAL_PARA_END.search(line):
             # include the paragraph line itself
-            if not buf:
+            if bstart is None:
                 bstart = pos
-            buf.append(line)
             pos += ln
             i += 1
             # optional blank line
-            if i < n and lines[i].strip() == "":
-                buf.append(lines[i])
+            if i < n and lines[i].isspace():
                 pos += len(lines[i])
                 i += 1
             # consume indented block
             base_indent = None
             while i < n:
                 nxt = lines[i]
-                if nxt.strip() == "":
-                    buf.append(nxt)
+                if nxt.isspace():
                     pos += len(nxt)
                     i += 1
                     continue
@@ -474,7 +473,6 @@ def _split_rst_blocks(text: str, tokenizer) -> list[Block]:
                 if base_indent is None:
                     base_indent = ind
                 if ind >= max(1, base_indent):
-                    buf.append(nxt)
                     pos += len(nxt)
                     i += 1
                 else:
@@ -483,9 +481,8 @@ def _split_rst_blocks(text: str, tokenizer) -> list[Block]:
             continue
 
         # Default accumulate
-        if not buf:
+        if bstart is None:
             bstart = pos
-        buf.append(line)
         pos += ln
         i += 1
 
@@ -877,12 +874,14 @@ def iter_packed_blocks(
                 continue
             # Overlap: add an approximate tail from current chunk to start next one
             if overlap_tokens > 0:
-                cur_text = "".join(cur_buf)
-                tail = _take_tail_chars_for_overlap(cur_text, overlap_tokens, cur_mode)
-                prev_end = (cur_start or 0) + len(cur_text)
+                # Take the tail from the flushed chunk text rather than joining twice.
+                tail = ""
+                prev_end = cur_start or 0
                 flushed = flush()
                 if flushed:
                     yield flushed
+                    tail = _take_tail_chars_for_overlap(flushed[0], overlap_tokens, cur_mode)
+                    prev_end = flushed[2]
                 # seed next with tail and set origin to (prev_end - tail_len)
                 cur_buf = [tail, block.text]
                 cur_start = max(0, prev_end - len(tail))
@@ -933,29 +932,29 @@ def _split_code_lines(text: str, tokenizer) -> list[Block]:
     blocks: list[Block] = []
     start = 0
     pos = 0
-    buf: list[str] = []
+    buf_lines = 0
 
     def flush():
-        nonlocal buf, start, pos
-        if buf:
-            s = "".join(buf)
+        nonlocal buf_lines
+        if buf_lines:
+            s = text[start:pos]
             tokens = count_tokens(s, tokenizer, "code")
-            blocks.append(Block(s, start, start + len(s), tokens, kind="code"))
-            buf = []
+            blocks.append(Block(s, start, pos, tokens, kind="code"))
+            buf_lines = 0
     blank_run = 0
     MAX_RUN = 4000  # soft guard for giant files
     for ln in lines:
-        if not buf:
+        if not buf_lines:
             start = pos
-        buf.append(ln)
+        buf_lines += 1
         pos += len(ln)
-        if ln.strip() == "":
+        if ln.isspace():
             blank_run += 1
         else:
             if blank_run >= 2:
                 flush()
             blank_run =0
-        if len(buf) >= MAX_RUN:
+        if buf_lines >= MAX_RUN:
             flush()
             blank_run = 0
     flush()
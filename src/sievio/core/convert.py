@@ -454,41 +454,9 @@ def iter_records_for_file(
     Yields:
         Dict[str, object]: Chunk or extractor record dictionaries.
     """
-    extractor_recs: list[dict[str, object]] = []
     context_meta = record_ctx.metadata_seed
     extra_meta = dict(context_meta) if context_meta else None
     file_nlines = 0 if text == "" else text.count("\n") + 1
-    if extractors:
-        for extractor in extractors:
-            try:
-                out = extractor.extract(text=text, path=rel_path, context=context)
-                if not out:
-                    continue
-                for rec in out:
-                    if not isinstance(rec, Mapping):
-                        log.warning(
-                            "Extractor %s produced non-mapping for %s; skipping",
-                            getattr(extractor, "name", extractor),
-                            rel_path,
-                        )
-                        continue
-                    try:
-                        extractor_recs.append(dict(rec))
-                    except Exception as exc:
-                        log.warning(
-                            "Extractor %s record coercion failed for %s: %s",
-                            getattr(extractor, "name", extractor),
-                            rel_path,
-                            exc,
-                        )
-            except Exception as exc:
-                log.warning(
-                    "Extractor %s failed for %s: %s",
-                    getattr(extractor, "name", extractor),
-                    rel_path,
-                    exc,
-                )
-                continue
 
     mode, fmt = classify_path_kind(rel_path)
     chunk_dicts = list(
@@ -502,14 +470,18 @@ def iter_records_for_file(
     )
     total_chunks = len(chunk_dicts)
     attach_lang = record_ctx.chunk.attach_language_metadata
+    # Per-file values are hoisted out of the per-chunk loop.
+    repo_full_name = context.repo_full_name if context else None
+    repo_url = context.repo_url if context else None
+    license_id = context.license_id if context else None
 
     for idx, chunk in enumerate(chunk_dicts, start=1):
         yield build_record(
             text=chunk.get("text", ""),
             rel_path=rel_path,
-            repo_full_name=(context.repo_full_name if context else None),
-            repo_url=(context.repo_url if context else None),
-            license_id=(context.license_id if context else None),
+            repo_full_name=repo_full_name,
+            repo_url=repo_url,
+            license_id=license_id,
             encoding=encoding,
             had_replacement=had_replacement,
             chunk_id=idx,
@@ -523,16 +495,47 @@ def iter_records_for_file(
             url=source_url,
             source_domain=source_domain,
         )
+    del chunk_dicts
 
-    if extractor_recs and context_meta:
-        for rec in extractor_recs:
-            meta = rec.get("meta")
-            if isinstance(meta, dict):
-                for key, value in context_meta.items():
-                    meta.setdefault(key, value)
-
-    for rec in extractor_recs:
-        yield rec
+    # Extractor records follow the chunk records and are streamed one at a time
+    # rather than buffered for the whole file.
+    for extractor in extractors:
+        try:
+            out = extractor.extract(text=text, path=rel_path, context=context)
+            if not out:
+                continue
+            for rec in out:
+                if not isinstance(rec, Mapping):
+                    log.warning(
+                        "Extractor %s produced non-mapping for %s; skipping",
+                        getattr(extractor, "name", extractor),
+                        rel_path,
+                    )
+                    continue
+                try:
+                    rec_dict: dict[str, object] = dict(rec)
+                except Exception as exc:
+                    log.warning(
+                        "Extractor %s record coercion failed for %s: %s",
+                        getattr(extractor, "name", extractor),
+                        rel_path,
+                        exc,
+                    )
+                    continue
+                if context_meta:
+                    meta = rec_dict.get("meta")
+                    if isinstance(meta, dict):
+                        for key, value in context_meta.items():
+                            meta.setdefault(key, value)
+                yield rec_dict
+        except Exception as exc:
+            log.warning(
+                "Extractor %s failed for %s: %s",
+                getattr(extractor, "name", extractor),
+                rel_path,
+                exc,
+            )
+            continue
 
 
 def iter_records_from_bytes(
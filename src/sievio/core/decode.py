@@ -63,19 +63,20 @@ log = get_logger(__name__)
 # Encoding helpers: BOM + UTF-16/32 heuristics
 # -----------------------------------------
 
-_BOMS: tuple[tuple[bytes, str], ...] = (
-    (b"\xEF\xBB\xBF", "utf-8-sig"),
-    (b"\xFE\xFF", "utf-16-be"),
-    (b"\xFF\xFE", "utf-16-le"),
-    (b"\x00\x00\xFE\xFF", "utf-32-be"),
-    (b"\xFF\xFE\x00\x00", "utf-32-le"),
+# BOM tables keyed by prefix length; longer BOMs are checked first because the
+# UTF-32-LE BOM starts with the UTF-16-LE one.
+_BOMS_BY_LEN: tuple[tuple[int, dict[bytes, str]], ...] = (
+    (4, {b"\x00\x00\xFE\xFF": "utf-32-be", b"\xFF\xFE\x00\x00": "utf-32-le"}),
+    (3, {b"\xEF\xBB\xBF": "utf-8-sig"}),
+    (2, {b"\xFE\xFF": "utf-16-be", b"\xFF\xFE": "utf-16-le"}),
 )
 
 
 def _detect_bom(data: bytes) -> str | None:
     """Return encoding implied by a BOM if present."""
-    for sig, enc in sorted(_BOMS, key=lambda item: len(item[0]), reverse=True):
-        if data.startswith(sig):
+    for size, table in _BOMS_BY_LEN:
+        enc = table.get(data[:size])
+        if enc is not None:
             return enc
     return None
 
@@ -95,8 +96,8 @@ def _guess_utf16_endian_from_nuls(sample: bytes) -> str | None:
     """
     if not sample:
         return None
-    even_nuls = sum(1 for i in range(0, len(sample), 2) if sample[i] == 0)
-    odd_nuls = sum(1 for i in range(1, len(sample), 2) if sample[i] == 0)
+    even_nuls = sample[0::2].count(0)
+    odd_nuls = sample[1::2].count(0)
     total_nuls = even_nuls + odd_nuls
     if total_nuls < max(4, len(sample) // 64):  # need a few to be confident
         return None
@@ -126,12 +127,31 @@ def _normalize_newlines(s: str) -> tuple[str, bool]:
     return normalized, normalized != s
 
 
+class _ControlStripTable(dict[int, int | None]):
+    """``str.translate`` table that deletes unsafe controls, filled on first sight.
+
+    Code points are classified once (category ``C*`` other than TAB/LF, or a
+    zero-width character) and cached, so translation stays in C afterwards.
+    """
+
+    def __missing__(self, cp: int) -> int | None:
+        ch = chr(cp)
+        unsafe = cp in _ZERO_WIDTH or (
+            ch != "\n" and ch != "\t" and _ud.category(ch)[0] == "C"
+        )
+        value = None if unsafe else cp
+        self[cp] = value
+        return value
+
+
+_STRIP_TABLE = _ControlStripTable()
+# ASCII bytes that survive post-processing unchanged (printables plus TAB/LF).
+_ASCII_SAFE_BYTES = bytes(range(0x20, 0x7F)) + b"\t\n"
+
+
 def _strip_unsafe_controls(s: str) -> tuple[str, int]:
     """Strip control and zero-width characters while keeping TAB and LF."""
-    filtered = "".join(
-        ch for ch in s
-        if (ch == "\n" or ch == "\t" or _ud.category(ch)[0] != "C") and ord(ch) not in _ZERO_WIDTH
-    )
+    filtered = s.translate(_STRIP_TABLE)
     return filtered, max(0, len(s) - len(filtered))
 
 
@@ -166,11 +186,14 @@ def _unicode_normalize(s: str, *, form: NormalizeForm = "NFC") -> tuple[str, boo
 # ----------------------
 
 # Quick check for typical UTF-8-as-cp1252 sequences (e.g., 'Ã©', 'â€™', 'Â').
-_MOJI_REGEX = re.compile(r"[\u00C0-\u00FF][\u0080-\u00FF]|Ã.|â.|Â|Â\s|\ufffd")
+_MOJI_REGEX = re.compile(r"[\u00C0-\u00FF][\u0080-\u00FF]|[Ãâ].|Â|\ufffd")
 
 
 def _mojibake_score(s: str) -> int:
     """Count likely mojibake sequences in the string."""
+    if s.isascii():
+        # Every pattern branch needs a non-ASCII code point; skip the regex scan.
+        return 0
     return len(_MOJI_REGEX.findall(s))
 
 
@@ -185,7 +208,8 @@ def _maybe_repair_cp1252_utf8(text_cp1252: str) -> str:
     Returns:
         str: Repaired or original text, whichever looks cleaner.
     """
-    if _mojibake_score(text_cp1252) == 0:
+    orig_score = _mojibake_score(text_cp1252)
+    if orig_score == 0:
         return text_cp1252
     try:
         raw = text_cp1252.encode("cp1252", errors="strict")
@@ -194,7 +218,6 @@ def _maybe_repair_cp1252_utf8(text_cp1252: str) -> str:
         return text_cp1252
     # Accept the repair only if it *reduces* the mojibake noise.
     fixed_score = _mojibake_score(fixed)
-    orig_score = max(1, _mojibake_score(text_cp1252))
     return fixed if fixed_score * 3 < orig_score else text_cp1252
 
 
@@ -231,6 +254,13 @@ def decode_bytes(
     if not data:
         return DecodedText("", "utf-8", False, DecodeProvenance())
 
+    # 0) Pure-ASCII fast path: when there is no CR and nothing to strip,
+    # post-processing is a no-op (every normalization form is identity on ASCII).
+    if data.isascii():
+        unsafe = data.translate(None, _ASCII_SAFE_BYTES)
+        if not unsafe or (not strip_controls and b"\r" not in unsafe):
+            return DecodedText(data.decode("ascii"), "utf-8", False, DecodeProvenance())
+
     def _finalize(
         text: str,
         encoding: str,
@@ -291,7 +291,9 @@ class JSONLQualityScorer:
             doc_id = hashlib.sha1(text.encode("utf-8")).hexdigest()
         content_hash = meta.get("sha256")
         if not content_hash:
-            content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            content_hash = hashlib.sha256(
+                text.encode("utf-8"), usedforsecurity=False
+            ).hexdigest()
 
         N = int(meta.get("tokens") or approx_tokens(text))
         Tlo, Thi = target_band(lang_l, heuristics=self.heuristics)
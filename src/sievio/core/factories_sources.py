@@ -259,14 +259,14 @@ class GitHubZipSourceFactory(SourceFactory):
         validate_options_for_dataclass(
             GitHubSourceConfig,
             options=options,
-            ignore_keys=("url",),
+            ignore_keys=("url", "ref"),
             context="sources.specs.github_zip",
         )
         gh_cfg = build_config_from_defaults_and_options(
             GitHubSourceConfig,
             defaults=defaults,
             options=options,
-            ignore_keys=("url",),
+            ignore_keys=("url", "ref"),
         )
         src = make_github_zip_source(
             url,
@@ -274,6 +274,7 @@ class GitHubZipSourceFactory(SourceFactory):
             context=repo_ctx,
             download_timeout=ctx.http_config.timeout,
             http_client=http_client,
+            ref=options.get("ref"),
         )
         return [src]
 
@@ -638,6 +639,7 @@ def make_github_zip_source(
     context: RepoContext | None,
     download_timeout: float | None,
     http_client: SafeHttpClient | None = None,
+    ref: str | None = None,
 ):
     """
     Build a GitHubZipSource for a GitHub archive URL.
@@ -650,6 +652,8 @@ def make_github_zip_source(
         download_timeout (float | None): Request timeout for downloading the
             archive.
         http_client (SafeHttpClient | None): Optional HTTP client override.
+        ref (str | None): Already-resolved ref to download instead of looking
+            up the default branch.
 
     Returns:
         GitHubZipSource: Configured GitHub zip source.
@@ -667,6 +671,7 @@ def make_github_zip_source(
         context=context,
         download_timeout=download_timeout,
         http_client=http_client,
+        ref=ref,
     )
 
 
@@ -701,7 +706,7 @@ def make_web_pdf_source(
 
 def make_bytes_handlers(
     registry: BytesHandlerRegistry | None = None,
-) -> Sequence[tuple[Sniff, BytesHandler]]:
+) -> tuple[tuple[Sniff, BytesHandler], ...]:
     """
     Return the default sniff/handler pairs for binary formats.
 
@@ -710,8 +715,8 @@ def make_bytes_handlers(
             resolution. Falls back to the global registry.
 
     Returns:
-        Sequence[Tuple[Sniff, BytesHandler]]: Registered sniff/handler pairs for
-        PDF, EVTX, and Parquet files.
+        Tuple[Tuple[Sniff, BytesHandler], ...]: Registered sniff/handler pairs
+        for PDF, EVTX, and Parquet files.
     """
     reg = registry or bytes_handler_registry
     if not reg.handlers():
@@ -727,7 +732,7 @@ def make_bytes_handlers(
             from ..sources import parquetio  # noqa: F401
         except Exception:
             pass
-    handlers = list(reg.handlers())
+    handlers = reg.handlers()
     if handlers:
         return handlers
     reg.register(_fallback_sniff_pdf, _fallback_handle_pdf)
@@ -760,7 +765,7 @@ def _fallback_sniff_evtx(data: bytes, rel: str) -> bool:
         return True
     if data.startswith(b"ElfFile"):
         return True
-    if b"ElfChnk" in data[:1_048_576]:
+    if data.find(b"ElfChnk", 0, 1_048_576) != -1:
         return True
     return False
 
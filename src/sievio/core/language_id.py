@@ -292,33 +292,41 @@ DEFAULT_LANGCFG = LanguageConfig()
 # Basic classifiers / hints
 # -----------------------
 
-def guess_lang_from_path(path: str | Path, cfg: LanguageConfig | None = None) -> tuple[str, str]:
-    """Return (kind, lang) for the given path."""
-    cfg = cfg or DEFAULT_LANGCFG
-    p = Path(path)
-    ext = p.suffix.lower()
-    name = p.name.lower()
+def name_and_suffix(path: str | Path) -> tuple[str, str]:
+    """Return the lowercased final component and suffix of ``path``.
+
+    Mirrors ``Path.name``/``Path.suffix`` without allocating a Path, which keeps
+    per-file classification cheap on large trees.
+    """
+    raw = str(path).rstrip("/\\")
+    name = raw[max(raw.rfind("/"), raw.rfind("\\")) + 1 :].lower()
+    dot = name.rfind(".")
+    suffix = name[dot:] if 0 < dot < len(name) - 1 else ""
+    return name, suffix
+
+
+def _guess_lang_from_parts(name: str, ext: str, cfg: LanguageConfig) -> tuple[str, str]:
     if name in SPECIAL_FILENAMES:
         return "code", SPECIAL_FILENAMES[name]
-    if ext in cfg.code_exts:
-        kind = "code"
-    elif ext in cfg.doc_exts:
-        kind = "doc"
-    else:
-        kind = "doc"
-
-    if ext.startswith(".") and len(ext) > 1:
-        fallback = ext[1:]
-    else:
-        fallback = "text"
-    lang = cfg.ext_lang.get(ext, fallback)
+    # Known doc extensions and unknown ones both classify as "doc", so only the
+    # code set needs a lookup.
+    kind = "code" if ext in cfg.code_exts else "doc"
+    lang = cfg.ext_lang.get(ext)
+    if lang is None:
+        lang = ext[1:] if ext.startswith(".") and len(ext) > 1 else "text"
     return kind, lang
 
 
+def guess_lang_from_path(path: str | Path, cfg: LanguageConfig | None = None) -> tuple[str, str]:
+    """Return (kind, lang) for the given path."""
+    name, ext = name_and_suffix(path)
+    return _guess_lang_from_parts(name, ext, cfg or DEFAULT_LANGCFG)
+
+
 def is_code_file(path: str | Path, cfg: LanguageConfig | None = None) -> bool:
     """Return True if the path extension is recognized as code."""
     cfg = cfg or DEFAULT_LANGCFG
-    return Path(path).suffix.lower() in cfg.code_exts
+    return name_and_suffix(path)[1] in cfg.code_exts
 
 
 def classify_path_kind(
@@ -336,11 +344,11 @@ def classify_path_kind(
         - unknown extensions return ("doc", None).
     """
     cfg = cfg or DEFAULT_LANGCFG
-    ext = Path(rel_path).suffix.lower()
+    name, ext = name_and_suffix(rel_path)
     if ext in cfg.doc_exts:
         return "doc", DOC_FORMAT_BY_EXT.get(ext)
 
-    kind, lang = guess_lang_from_path(rel_path, cfg)
+    kind, lang = _guess_lang_from_parts(name, ext, cfg)
     if kind == "code":
         return kind, lang
     return "doc", DOC_FORMAT_BY_EXT.get(ext, None)
@@ -447,10 +455,9 @@ class BaselineCodeLanguageDetector:
         self.cfg = cfg or DEFAULT_LANGCFG
 
     def _lang_from_filename(self, filename: str) -> str | None:
-        name = Path(filename).name.lower()
+        name, ext = name_and_suffix(filename)
         if name in SPECIAL_FILENAMES:
             return SPECIAL_FILENAMES[name]
-        ext = Path(filename).suffix.lower()
         return self.cfg.ext_lang.get(ext)
 
     def detect_code(
@@ -519,6 +526,7 @@ __all__ = [
     "LanguageConfig",
     "DEFAULT_LANGCFG",
     "DEFAULT_DISPLAY_NAMES",
+    "name_and_suffix",
     "guess_lang_from_path",
     "is_code_file",
     "classify_path_kind",
@@ -6,10 +6,10 @@ from __future__ import annotations
 
 import pickle
 import threading
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from contextlib import AbstractContextManager, ExitStack
 from dataclasses import dataclass, field, replace
-from pathlib import Path
+from functools import partial
 from typing import TYPE_CHECKING, Any, cast
 
 from .concurrency import (
@@ -38,6 +38,7 @@ from .interfaces import (
     Sink,
     Source,
 )
+from .language_id import name_and_suffix
 from .log import get_logger
 from .qc_controller import InlineQCController, InlineQCHook, QCSummaryTracker
 from .records import best_effort_record_path
@@ -213,6 +214,17 @@ def _apply_inline_qc_in_worker(
     return out, controller.tracker
 
 
+def _iter_with_close(iterable: Iterable[Record], stream: Any) -> Iterator[Record]:
+    """Yield from ``iterable`` and close ``stream`` once iteration ends."""
+    try:
+        yield from iterable
+    finally:
+        try:
+            stream.close()
+        except Exception:
+            pass
+
+
 @dataclass
 class _ProcessFileCallable:
     config: FileProcessingConfig
@@ -251,8 +263,7 @@ class _ProcessFileCallable:
         if stream_opener is None:
             reopenable = maybe_reopenable_local_path(item)
             if reopenable is not None:
-                def stream_opener() -> Any:
-                    return reopenable.open("rb")
+                stream_opener = partial(reopenable.open, "rb")
         can_stream = (
             self.executor_kind == "thread"
             and callable(extract_stream)
@@ -267,23 +278,12 @@ class _ProcessFileCallable:
                 if limit is None:
                     limit = _OPEN_STREAM_DEFAULT_MAX_BYTES
                 stream = make_limited_stream(raw_stream, limit)
-                stream_ref = stream
-
-                def _iter_with_close(iterable: Iterable[Record]) -> Iterable[Record]:
-                    try:
-                        yield from iterable
-                    finally:
-                        try:
-                            stream_ref.close()
-                        except Exception:
-                            pass
-
                 out = extract_stream(  # type: ignore[misc]
                     stream=stream,
                     path=str(rel),
                     context=ctx,
                 )
-                recs_iter = _iter_with_close(out if out is not None else ())
+                recs_iter = _iter_with_close(out if out is not None else (), stream)
                 stream = None
             except Exception:
                 if stream:
@@ -437,7 +437,7 @@ def _get_context_from_source(source: Source) -> RepoContext | None:
 def _ext_key(path: str) -> str:
     """Return lowercase file extension from a path-like string."""
     try:
-        return Path(path).suffix.lower()
+        return name_and_suffix(path)[1]
     except Exception:
         return ""
 
@@ -847,32 +847,39 @@ class PipelineEngine:
         stats = self.stats
         self._ensure_record_chain()
         chain = self._record_chain
+        # Bind write methods once per file rather than once per record and sink.
+        writers = [(sink, sink.write) for sink in sinks]
 
-        for record in recs:
-            current: Record | None = record
-            for step in chain:
+        # Count written records locally and publish once per file (also on error).
+        written = 0
+        try:
+            for record in recs:
+                current: Record | None = record
+                for step in chain:
+                    if current is None:
+                        break
+                    current = step(current)
                 if current is None:
-                    break
-                current = step(current)
-            if current is None:
-                continue
-            record = current
-            wrote_any = False
-            for sink in sinks:
-                try:
-                    sink.write(record)
-                    wrote_any = True
-                except Exception as exc:
-                    self.log.warning(
-                        "Sink %s failed to write record for %s: %s",
-                        getattr(sink, "__class__", type(sink)).__name__,
-                        getattr(item, "path", "<unknown>"),
-                        exc,
-                    )
-                    stats.sink_errors += 1
+                    continue
+                record = current
+                wrote_any = False
+                for sink, write in writers:
+                    try:
+                        write(record)
+                        wrote_any = True
+                    except Exception as exc:
+                        self.log.warning(
+                            "Sink %s failed to write record for %s: %s",
+                            getattr(sink, "__class__", type(sink)).__name__,
+                            getattr(item, "path", "<unknown>"),
+                            exc,
+                        )
+                        stats.sink_errors += 1
 
-            if wrote_any:
-                stats.records += 1
+                if wrote_any:
+                    written += 1
+        finally:
+            stats.records += written
 
     def _iter_source_items(self, sources: Sequence[Source]) -> Iterable[_WorkItem]:
         """Iterate work items from sources while honoring hooks.
@@ -233,6 +233,10 @@ def repetition_rate(
     return reps / max(1, len(s) - k + 1)
 
 
+# Symbols counted by code_complexity; one str.count pass each runs in C.
+_CODE_PUNCT = "{}();[],:+-*/=<>&|%"
+
+
 def code_complexity(s: str, *, heuristics: QCHeuristics | None = None) -> float:
     """Score code-likeness using punctuation density and line lengths.
 
@@ -248,8 +252,7 @@ def code_complexity(s: str, *, heuristics: QCHeuristics | None = None) -> float:
     thresh = heuristics.code_short_line_threshold if heuristics is not None else 60
     w_punct = heuristics.code_punct_weight if heuristics is not None else 0.5
     w_short = heuristics.code_short_line_weight if heuristics is not None else 0.5
-    punctuation = set("{}();[],:+-*/=<>&|%")
-    punct = sum(1 for ch in s if ch in punctuation)
+    punct = sum(map(s.count, _CODE_PUNCT))
     lines = s.splitlines()
     short_lines = sum(1 for ln in lines if len(ln.strip()) <= thresh)
     total_lines = max(1, len(lines))
@@ -322,6 +325,10 @@ def _tokenize_for_simhash(text: str) -> Iterable[str]:
 _DEFAULT_SIMHASH_MAX_TOKENS = 20000
 _DEFAULT_REPETITION_MAX_GRAMS = 20000
 _DEFAULT_MINHASH_MAX_SHINGLES = 20000
+# Per-bit translate tables mapping a byte to 1 when the given bit is set, else 0.
+_SIMHASH_BIT_TABLES = tuple(
+    bytes((b >> bit) & 1 for b in range(256)) for bit in range(8)
+)
 
 
 def _fletcher32(data: bytes) -> int:
@@ -336,15 +343,14 @@ def _fletcher32(data: bytes) -> int:
     return (sum2 << 16) | sum1
 
 
-def _token_hash64(token: str) -> int:
-    """Hash a token into a deterministic 64-bit value."""
-    digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
-    return int.from_bytes(digest, "little")
+def _token_digest64(token: str) -> bytes:
+    """Return the 8-byte BLAKE2b digest used as a token's 64-bit hash."""
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
 
 
-def _feature_hash(token: str) -> int:
-    """Hash a token into a 64-bit value for Simhash features."""
-    return _token_hash64(token)
+def _token_hash64(token: str) -> int:
+    """Hash a token into a deterministic 64-bit value."""
+    return int.from_bytes(_token_digest64(token), "little")
 
 
 def simhash64(text: str, *, max_tokens: int | None = None) -> int:
@@ -360,17 +366,24 @@ def simhash64(text: str, *, max_tokens: int | None = None) -> int:
         except Exception:
             if accel_required():
                 raise
-    v = [0] * 64
-    for idx, tok in enumerate(_tokenize_for_simhash(text)):
-        if max_tokens is not None and idx >= max_tokens:
+    digests = bytearray()
+    n = 0
+    for tok in _tokenize_for_simhash(text):
+        if max_tokens is not None and n >= max_tokens:
             break
-        h = _feature_hash(tok)
-        for i in range(64):
-            v[i] += 1 if (h >> i) & 1 else -1
+        digests += _token_digest64(tok)
+        n += 1
+    if not n:
+        return 0
+    # Column-wise bit counts: bit i of each little-endian digest lives in byte i // 8,
+    # so count set bits per byte column in C via translate+count instead of per-token loops.
     out = 0
-    for i, val in enumerate(v):
-        if val > 0:
-            out |= 1 << i
+    for byte_idx in range(8):
+        column = bytes(digests[byte_idx::8])
+        for bit in range(8):
+            ones = column.translate(_SIMHASH_BIT_TABLES[bit]).count(1)
+            if 2 * ones > n:
+                out |= 1 << (byte_idx * 8 + bit)
     return out
 
 
@@ -8,6 +8,7 @@ import hashlib
 import logging
 from collections.abc import Mapping, MutableMapping
 from dataclasses import dataclass, field, fields
+from functools import cache, lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -47,11 +48,34 @@ log = get_logger(__name__)
 # Hashing utilities
 # -----------------------
 
-def sha256_text(text: str) -> str:
-    """Return hex sha256 of UTF-8 encoded text (no BOM)."""
-    h = hashlib.sha256()
-    h.update(text.encode("utf-8", "strict"))
-    return h.hexdigest()
+def sha256_text(text: str | bytes) -> str:
+    """Return hex sha256 of UTF-8 encoded text (no BOM).
+
+    Already-encoded ``bytes`` are hashed as-is, which lets callers that
+    needed the UTF-8 form anyway skip a second encode.
+
+    The digest is a content fingerprint, not a security primitive, so it is
+    requested with ``usedforsecurity=False`` to stay available (and on the
+    fast path) under FIPS-restricted OpenSSL builds.
+    """
+    data = text.encode("utf-8", "strict") if isinstance(text, str) else text
+    return hashlib.sha256(data, usedforsecurity=False).hexdigest()
+
+
+# Short texts (blank PDF pages, boilerplate chunks, license headers) repeat often
+# across a run; memoize their hash and token estimate. Longer texts bypass the
+# caches so they never pin large strings in memory.
+_CACHED_TEXT_MAX_CHARS = 2048
+
+
+@lru_cache(maxsize=4096)
+def _sha256_cached(text: str) -> str:
+    return sha256_text(text)
+
+
+@lru_cache(maxsize=4096)
+def _tokens_cached(text: str, kind: str) -> int:
+    return count_tokens(text, None, kind)
 
 
 # -----------------------
@@ -278,6 +302,18 @@ def check_record_schema(record: Mapping[str, Any], logger: Any | None = None) ->
         )
 
 
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Return dataclass field names for ``cls``, computed once per class."""
+    return tuple(f.name for f in fields(cls))
+
+
+@cache
+def _field_name_set(cls: type) -> frozenset[str]:
+    """Return dataclass field names for ``cls`` as a set for membership tests."""
+    return frozenset(_field_names(cls))
+
+
 def _meta_to_dict(obj: Any) -> dict[str, Any]:
     """Flatten dataclass fields and extras into a dictionary.
 
@@ -293,8 +329,7 @@ def _meta_to_dict(obj: Any) -> dict[str, Any]:
     out: dict[str, Any] = {}
     if obj is None:
         return out
-    for f in fields(obj):
-        name = f.name
+    for name in _field_names(type(obj)):
         if name == "extra":
             continue
         value = getattr(obj, name)
@@ -394,7 +429,7 @@ class RecordMeta:
         if kind is not None:
             data["kind"] = kind
         data.update(overrides)
-        field_names = {f.name for f in fields(cls)}
+        field_names = _field_name_set(cls)
         extra: dict[str, Any] = {}
         for key in list(data.keys()):
             if key not in field_names:
@@ -546,24 +581,31 @@ def build_record(
     Returns:
         Dict[str, object]: Record with ``text`` and normalized ``meta`` payload.
     """
-    rp = rel_path.replace("\\", "/")
+    rp = rel_path.replace("\\", "/") if "\\" in rel_path else rel_path
     cfg = langcfg or DEFAULT_LANGCFG
 
     # Derive language / estimation kind from extension when not provided
     kind, lang_hint = guess_lang_from_path(rp, cfg=cfg)
     if not lang:
         if lang_hint:
-            lang = cfg.display_names.get(lang_hint, lang_hint.capitalize())
+            display = cfg.display_names.get(lang_hint)
+            lang = display if display is not None else lang_hint.capitalize()
         else:
             lang = "Text"
 
     # Compute byte length and token estimate (approximate by default)
-    bcount = len(text.encode("utf-8", "strict"))
+    encoded = text.encode("utf-8", "strict")
+    bcount = len(encoded)
+    cacheable = len(text) <= _CACHED_TEXT_MAX_CHARS
     if tokens is not None:
         approx_tokens = tokens
         token_value = tokens
     else:
-        approx_tokens = count_tokens(text, None, "code" if kind == "code" else "doc")
+        token_kind = "code" if kind == "code" else "doc"
+        if cacheable:
+            approx_tokens = _tokens_cached(text, token_kind)
+        else:
+            approx_tokens = count_tokens(text, None, token_kind)
         token_value = approx_tokens
     nlines = 0 if text == "" else text.count("\n") + 1
 
@@ -604,7 +646,7 @@ def build_record(
         n_chunks=n_chunks_val,
         encoding=encoding,
         had_replacement=bool(had_replacement),
-        sha256=sha256_text(text),
+        sha256=_sha256_cached(text) if cacheable else sha256_text(encoded),
         approx_tokens=approx_tokens,
         tokens=token_value,
         bytes=bcount,
@@ -615,7 +657,7 @@ def build_record(
     )
 
     if extra_meta:
-        record_fields = {f.name for f in fields(RecordMeta)}
+        record_fields = _field_name_set(RecordMeta)
         for key, value in extra_meta.items():
             if key in record_fields or value is None:
                 continue
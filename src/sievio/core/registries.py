@@ -92,6 +92,10 @@ class SourceRegistry:
 
         return decorator
 
+    def copy(self) -> SourceRegistry:
+        """Return a registry with the same factories that registers independently."""
+        return SourceRegistry(_factories=dict(self._factories))
+
     def build_all(self, ctx: SourceFactoryContext, specs: Sequence[SourceSpec]) -> list[Source]:
         """Instantiate sources for each spec using the registered factories.
 
@@ -164,6 +168,10 @@ class SinkRegistry:
 
         return decorator
 
+    def copy(self) -> SinkRegistry:
+        """Return a registry with the same factories that registers independently."""
+        return SinkRegistry(_factories=dict(self._factories))
+
     def build_all(
         self,
         ctx: SinkFactoryContext,
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import gzip
+import io
 import json
 import os
 from collections.abc import Iterable, Mapping
@@ -12,6 +13,14 @@ from typing import Any, Self, TextIO
 
 from ..core.interfaces import Record, RepoContext
 
+# Records are small relative to this, so the handle issues one write() per ~1 MiB
+# of output instead of one per 8 KiB default buffer.
+_WRITE_BUFFER_BYTES = 1 << 20
+
+# json.dumps() builds a fresh JSONEncoder whenever non-default options are passed;
+# reuse one configured encoder for every record line instead.
+_encode_record = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
 
 class _BaseJSONLSink:
     """Shared JSONL sink logic with optional header support."""
@@ -58,7 +67,7 @@ class _BaseJSONLSink:
     def write(self, record: Mapping[str, Any]) -> None:
         """Write a single JSON record as a compact line."""
         assert self._fp is not None
-        self._fp.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self._fp.write(_encode_record(record) + "\n")
 
     def close(self) -> None:
         """Close any open handle and move the temp file into place."""
@@ -106,7 +115,7 @@ class _BaseJSONLSink:
             fp = self._open_append_handle(self._path)
             temp_opened = True
         for rec in records:
-            fp.write(json.dumps(dict(rec), ensure_ascii=False, separators=(",", ":")) + "\n")
+            fp.write(_encode_record(dict(rec)) + "\n")
         if temp_opened and fp is not None:
             fp.close()
 
@@ -123,10 +132,10 @@ class JSONLSink(_BaseJSONLSink):
         super().__init__(out_path, header_record=header_record)
 
     def _open_handle(self, path: Path):
-        return open(path, "w", encoding="utf-8", newline="")
+        return open(path, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_BYTES)
 
     def _open_append_handle(self, path: Path):
-        return open(path, "a", encoding="utf-8", newline="")
+        return open(path, "a", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_BYTES)
 
 
 class GzipJSONLSink(_BaseJSONLSink):
@@ -141,10 +150,17 @@ class GzipJSONLSink(_BaseJSONLSink):
         super().__init__(out_path, header_record=header_record)
 
     def _open_handle(self, path: Path):
-        return gzip.open(path, "wt", encoding="utf-8", newline="")
+        return self._open_text(path, "wb")
 
     def _open_append_handle(self, path: Path):
-        return gzip.open(path, "at", encoding="utf-8", newline="")
+        return self._open_text(path, "ab")
+
+    @staticmethod
+    def _open_text(path: Path, mode: str) -> TextIO:
+        # Same stack as gzip.open(..., "wt") plus a large buffer in front of the
+        # compressor, so zlib and the file see ~1 MiB writes instead of 8 KiB ones.
+        raw = io.BufferedWriter(gzip.GzipFile(path, mode), buffer_size=_WRITE_BUFFER_BYTES)
+        return io.TextIOWrapper(raw, encoding="utf-8", newline="")
 
 
 class PromptTextSink:
@@ -172,7 +188,9 @@ class PromptTextSink:
         self._path.parent.mkdir(parents=True, exist_ok=True)
         tmp_name = f"{self._path.name}.tmp"
         self._tmp_path = self._path.parent / tmp_name
-        self._fp = open(self._tmp_path, "w", encoding="utf-8", newline="")
+        self._fp = open(
+            self._tmp_path, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_BYTES
+        )
 
     def write(self, record: Mapping[str, Any]) -> None:
         """Write a heading and its associated text block.
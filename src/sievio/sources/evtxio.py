@@ -49,7 +49,8 @@ def sniff_evtx(data: bytes, rel: str) -> bool:
         return True
     if data.startswith(_EVTX_FILE_MAGIC):
         return True
-    if _EVTX_CHUNK_MAGIC in data[:_SNIFF_SCAN_LIMIT]:
+    # find() with an end bound scans in place instead of copying the prefix.
+    if data.find(_EVTX_CHUNK_MAGIC, 0, _SNIFF_SCAN_LIMIT) != -1:
         return True
     return False
 
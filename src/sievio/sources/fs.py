@@ -12,6 +12,7 @@ from pathlib import Path, PurePosixPath
 from typing import IO
 
 from ..core.interfaces import FileItem, RepoContext, Source
+from ..core.language_id import name_and_suffix
 from ..core.naming import normalize_extensions
 
 __all__ = [
@@ -387,10 +388,6 @@ def _load_gitignore_file(path: Path, repo_root: Path) -> list[GitignoreRule]:
 # Directory tree walking
 # ----------------------
 
-def _normalize_rel(root: Path, p: Path) -> str:
-    # Work with lexical paths so symlinks pointing outside the repo don't explode traversal
-    return p.relative_to(root).as_posix()
-
 def iter_repo_files(
     root: os.PathLike[str] | str,
     *,
@@ -420,83 +417,95 @@ def iter_repo_files(
     if not walk_root.is_dir():
         raise NotADirectoryError(walk_root)
 
-    # Matcher cache per directory path
-    matchers: dict[Path, GitignoreMatcher] = {walk_root: GitignoreMatcher()}
-
-    for dirpath, dirnames, filenames in os.walk(
-        walk_root, topdown=True, followlinks=follow_symlinks
-    ):
+    # Depth-first walk over os.scandir so file-type and symlink checks use the
+    # cached directory entry instead of re-stating every path prefix. Each
+    # stack entry carries the directory, its repo-relative POSIX path, and the
+    # gitignore matcher inherited from its parent.
+    stack: list[tuple[Path, str, GitignoreMatcher]] = [(walk_root, "", GitignoreMatcher())]
+    while stack:
+        dpath, drel, matcher = stack.pop()
+        try:
+            with os.scandir(dpath) as it:
+                entries = list(it)
+        except OSError:
+            continue
         # Ensure deterministic order across platforms
         try:
-            dirnames.sort(key=str.casefold)
-            filenames.sort(key=str.casefold)
+            entries.sort(key=lambda e: e.name.casefold())
         except Exception:
-            dirnames.sort()
-            filenames.sort()
-        dpath = Path(dirpath)
-        matcher = matchers.get(dpath)
-        if matcher is None:
-            matcher = GitignoreMatcher()
-            matchers[dpath] = matcher
+            entries.sort(key=lambda e: e.name)
+        dir_entries: list[os.DirEntry[str]] = []
+        file_entries: list[os.DirEntry[str]] = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            (dir_entries if is_dir else file_entries).append(entry)
 
         # If this directory has a .gitignore, extend matcher for this subtree
         if respect_gitignore:
-            gi = dpath / ".gitignore"
-            if gi.is_file():
-                rules = _load_gitignore_file(gi, walk_root)
-                if rules:
-                    matcher = matcher.with_additional(rules)
-                    matchers[dpath] = matcher
-
-        # Prune directories in-place
-        for name in list(dirnames):
+            for entry in file_entries:
+                if entry.name == ".gitignore":
+                    if entry.is_file():
+                        rules = _load_gitignore_file(dpath / entry.name, walk_root)
+                        if rules:
+                            matcher = matcher.with_additional(rules)
+                    break
+
+        # Prune directories
+        subdirs: list[tuple[Path, str, GitignoreMatcher]] = []
+        for entry in dir_entries:
+            name = entry.name
             if skip_hidden and name.startswith('.'):
-                dirnames.remove(name)
                 continue
             if name in DEFAULT_SKIP_DIRS:
-                dirnames.remove(name)
                 continue
             subdir = dpath / name
-            try:
-                rel = _normalize_rel(walk_root, subdir)
-            except Exception:
-                dirnames.remove(name)
-                continue
-            if policy.normalize_file(subdir, lexical_rel=Path(rel)) is None:
-                dirnames.remove(name)
+            rel = f"{drel}/{name}" if drel else name
+            if follow_symlinks:
+                if policy.normalize_file(subdir, lexical_rel=Path(rel)) is None:
+                    continue
+            elif entry.is_symlink():
+                # Ancestors were vetted when they were entered, so only this
+                # entry can introduce a symlink into the chain.
                 continue
             if respect_gitignore and matcher.ignores(rel + "/", is_dir=True):
-                dirnames.remove(name)
                 continue
-            # Seed child's matcher with current matcher; extend if the child has its own
-            # .gitignore.
-            matchers[subdir] = matcher
+            subdirs.append((subdir, rel, matcher))
 
         # Files
-        for fname in filenames:
+        for entry in file_entries:
+            fname = entry.name
             if skip_hidden and fname.startswith('.'):
                 continue
             if fname in DEFAULT_SKIP_FILES:
                 continue
-            fpath = dpath / fname
-            try:
-                rel = _normalize_rel(walk_root, fpath)
-            except Exception:
-                continue
-            normalized = policy.normalize_file(fpath, lexical_rel=Path(rel))
-            if normalized is None:
-                continue
-            rel_posix, origin_path = normalized
-            if respect_gitignore and matcher.ignores(rel, is_dir=False):
-                continue
-            ext = Path(rel_posix).suffix.lower()
+            # Extension filters only need the file name; apply them before the
+            # per-file containment/symlink checks.
+            ext = name_and_suffix(fname)[1]
             if include_exts is not None and ext not in include_exts:
                 continue
             if exclude_exts is not None and ext in exclude_exts:
                 continue
+            rel = f"{drel}/{fname}" if drel else fname
             try:
-                stat_result = origin_path.stat()
-            except Exception:
+                if follow_symlinks:
+                    normalized = policy.normalize_file(dpath / fname, lexical_rel=Path(rel))
+                    if normalized is None:
+                        continue
+                    _, origin_path = normalized
+                    if respect_gitignore and matcher.ignores(rel, is_dir=False):
+                        continue
+                    stat_result = origin_path.stat()
+                else:
+                    if entry.is_symlink():
+                        continue
+                    origin_path = dpath / fname
+                    if respect_gitignore and matcher.ignores(rel, is_dir=False):
+                        continue
+                    stat_result = entry.stat(follow_symlinks=False)
+            except OSError:
                 continue
             if not stat.S_ISREG(stat_result.st_mode):
                 continue
@@ -505,6 +514,8 @@ def iter_repo_files(
                 continue
             yield origin_path
 
+        stack.extend(reversed(subdirs))
+
 
 def collect_repo_files(*args, **kwargs) -> list[Path]:
     """Return a list of files produced by iter_repo_files.
@@ -514,9 +525,9 @@ def collect_repo_files(*args, **kwargs) -> list[Path]:
     return list(iter_repo_files(*args, **kwargs))
 
 
-def _is_hidden_rel(rel: Path) -> bool:
+def _is_hidden_rel(rel: Path | str) -> bool:
     """Return True if any segment of the relative path is hidden."""
-    parts = rel.parts if isinstance(rel, Path) else Path(rel).parts
+    parts = rel.parts if isinstance(rel, Path) else rel.replace("\\", "/").split("/")
     for part in parts:
         if part in (".", ".."):
             continue
@@ -635,10 +646,9 @@ class PatternFileSource(Source):
                 if rel_str in seen:
                     continue
                 seen.add(rel_str)
-                rel_path = Path(rel_str)
-                if skip_hidden and _is_hidden_rel(rel_path):
+                if skip_hidden and _is_hidden_rel(rel_str):
                     continue
-                ext = rel_path.suffix.lower()
+                ext = name_and_suffix(rel_str)[1]
                 if self.include_exts is not None and ext not in self.include_exts:
                     continue
                 if self.exclude_exts is not None and ext in self.exclude_exts:
@@ -669,7 +679,6 @@ class PatternFileSource(Source):
                         )
                     except Exception:
                         continue
-                rel_str = rel_path.as_posix()
                 yield FileItem(
                     path=rel_str,
                     data=prefix_data,
@@ -15,13 +15,13 @@ import urllib.error
 import urllib.parse
 import urllib.request
 import zipfile
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
-from pathlib import Path
 from typing import Any
 
 from ..core import safe_http
 from ..core.interfaces import FileItem, RepoContext, Source
+from ..core.language_id import name_and_suffix
 from ..core.licenses import apply_license_to_context, detect_license_in_zip
 from ..core.log import get_logger
 from ..core.naming import normalize_extensions
@@ -277,7 +277,6 @@ def get_repo_license_spdx(
 
 _DEF_ZIP_TIMEOUT = 60
 
-
 def download_zipball_to_temp(
     spec: RepoSpec,
     *,
@@ -447,6 +446,7 @@ def iter_zip_members(
     max_total_uncompressed: int = 2 * 1024 * 1024 * 1024,  # 2 GiB cap across all files
     max_members: int = 200_000,
     max_compression_ratio: float = 100.0,                   # file_size / compress_size
+    name_filter: Callable[[str], bool] | None = None,
 ) -> Iterator[tuple[str, bytes, int]]:
     """Iterates safe members of a repository zipball.
 
@@ -459,6 +459,9 @@ def iter_zip_members(
         max_total_uncompressed (int): Maximum total uncompressed bytes.
         max_members (int): Maximum number of files to process.
         max_compression_ratio (float): Maximum allowed compression ratio.
+        name_filter (Callable[[str], bool] | None): Optional predicate on the
+            relative path; members it rejects are skipped without being
+            decompressed and do not count toward the byte budget.
 
     Yields:
         tuple[str, bytes, int]: Relative path, extracted bytes, and
@@ -505,6 +508,8 @@ def iter_zip_members(
             is_symlink = (zi.external_attr >> 16) & 0o170000 == 0o120000
             if is_symlink:
                 continue
+            if name_filter is not None and not name_filter(rel):
+                continue
 
             comp_sz = int(getattr(zi, "compress_size", 0) or 0)
             file_sz = int(getattr(zi, "file_size", 0) or 0)
@@ -565,7 +570,9 @@ class GitHubZipSource(Source):
     """Manages the lifecycle of a GitHub zipball for use as a source.
 
     Downloads on entry and cleans up the temporary file on exit to avoid
-    buildup even when exceptions occur.
+    buildup even when exceptions occur. A caller that already downloaded
+    the zipball can hand it over with ``use_existing_zip``; that file is used
+    as-is and left for the caller to remove.
     """
 
     def __init__(
@@ -576,6 +583,7 @@ class GitHubZipSource(Source):
         context: RepoContext | None = None,
         download_timeout: float | None = None,
         http_client: safe_http.SafeHttpClient | None = None,
+        ref: str | None = None,
     ) -> None:
         """Initializes the source with a GitHub repository URL.
 
@@ -587,6 +595,8 @@ class GitHubZipSource(Source):
             download_timeout (float | None): Optional download timeout.
             http_client (safe_http.SafeHttpClient | None): Optional HTTP
                 client to reuse.
+            ref (str | None): Already-resolved ref to download. Overrides
+                any ref in ``url`` and skips the default-branch lookup.
         """
         spec = parse_github_url(url)
         if not spec:
@@ -596,20 +606,35 @@ class GitHubZipSource(Source):
         self.context = context
         self._subpath = spec.subpath.strip("/").replace("\\", "/") if spec.subpath else None
         self._zip_path: str | None = None
+        self._given_zip_path: str | None = None
         self._download_timeout = download_timeout
         self._http_client = http_client
+        self._ref = ref
         self.include_exts = normalize_extensions(getattr(config, "include_exts", None))
         self.exclude_exts = normalize_extensions(getattr(config, "exclude_exts", None))
 
+    def use_existing_zip(self, zip_path: str) -> None:
+        """Reads ``zip_path`` on entry instead of downloading the zipball.
+
+        The file is not deleted on exit; the caller keeps ownership.
+
+        Args:
+            zip_path (str): Previously downloaded zipball for this repository.
+        """
+        self._given_zip_path = zip_path
+
     def __enter__(self) -> GitHubZipSource:
         """Downloads the zipball and performs optional license detection."""
 
         client = self._http_client or safe_http.get_global_http_client()
-        if self._download_timeout is None:
-            self._zip_path = download_zipball_to_temp(self.spec, client=client)
+        if self._given_zip_path:
+            self._zip_path = self._given_zip_path
+        elif self._download_timeout is None:
+            self._zip_path = download_zipball_to_temp(self.spec, ref=self._ref, client=client)
         else:
             self._zip_path = download_zipball_to_temp(
                 self.spec,
+                ref=self._ref,
                 timeout=self._download_timeout,
                 client=client,
             )
@@ -622,12 +647,26 @@ class GitHubZipSource(Source):
     def __exit__(self, exc_type, exc, tb) -> None:
         """Deletes the downloaded zipball when exiting the context."""
 
-        if self._zip_path:
+        if self._zip_path and self._zip_path != self._given_zip_path:
             try:
                 os.remove(self._zip_path)
             except OSError as e:
                 log.debug("temp zip cleanup failed for %s: %s", self._zip_path, e)
-            self._zip_path = None
+        self._zip_path = None
+
+    def _wants_member(self, rel_path: str) -> bool:
+        """Return True if a zip member passes the subpath and extension filters."""
+        rel_norm = rel_path.replace("\\", "/")
+        if self._subpath:
+            prefix = self._subpath
+            if not (rel_norm == prefix or rel_norm.startswith(f"{prefix}/")):
+                return False
+        ext = name_and_suffix(rel_norm)[1]
+        if self.include_exts is not None and ext not in self.include_exts:
+            return False
+        if self.exclude_exts is not None and ext in self.exclude_exts:
+            return False
+        return True
 
     def iter_files(self) -> Iterable[FileItem]:
         """Yields file items from the downloaded zipball with filters applied.
@@ -644,17 +683,9 @@ class GitHubZipSource(Source):
             max_total_uncompressed=cfg.max_total_uncompressed,
             max_members=cfg.max_members,
             max_compression_ratio=cfg.max_compression_ratio,
+            name_filter=self._wants_member,
         ):
             rel_norm = rel_path.replace("\\", "/")
-            if self._subpath:
-                prefix = self._subpath
-                if not (rel_norm == prefix or rel_norm.startswith(f"{prefix}/")):
-                    continue
-            ext = Path(rel_norm).suffix.lower()
-            if self.include_exts is not None and ext not in self.include_exts:
-                continue
-            if self.exclude_exts is not None and ext in self.exclude_exts:
-                continue
             yield FileItem(
                 path=rel_norm,
                 data=data,
@@ -5,7 +5,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import os
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from io import BytesIO
 from typing import Any, Protocol, cast
@@ -14,10 +15,29 @@ from pypdf import PdfReader
 
 from ..core.chunk import ChunkPolicy, chunk_text
 from ..core.interfaces import Record, RepoContext
+from ..core.log import get_logger
 from ..core.records import build_record
 
 # Re-export for DI registration
-__all__ = ["extract_pdf_records", "sniff_pdf", "handle_pdf"]
+__all__ = ["extract_pdf_records", "iter_pdf_records", "sniff_pdf", "handle_pdf"]
+
+log = get_logger(__name__)
+
+_PDF_BACKEND_ENV = "SIEVIO_PDF_BACKEND"
+_WARNED_BACKENDS: set[str] = set()
+# Separator placed between page texts when a document is chunked as a whole.
+_PAGE_SEP = "\n\n"
+_PDFIUM_META_KEYS = {
+    "Title": "title",
+    "Author": "author",
+    "Subject": "subject",
+    "Creator": "creator",
+    "Producer": "producer",
+}
+_PDFIUM_DATE_KEYS = {
+    "CreationDate": "creation_date",
+    "ModDate": "modification_date",
+}
 
 def sniff_pdf(data: bytes, rel: str) -> bool:
     """Detects whether the payload looks like a PDF file.
@@ -48,7 +68,7 @@ def handle_pdf(
     Returns:
         Iterable[Record] | None: Extracted records or None on failure.
     """
-    return extract_pdf_records(
+    return iter_pdf_records(
         data,
         rel_path=rel,
         policy=policy,
@@ -155,7 +175,136 @@ def _collect_pdf_metadata(reader: PdfReader) -> dict[str, Any]:
 
     return out
 
-def extract_pdf_records(
+
+def _pdf_backend() -> str:
+    """Return the text-extraction backend selected via ``SIEVIO_PDF_BACKEND``.
+
+    ``pypdf`` (the default) ships with the ``pdf`` extra. ``pypdfium2`` opts in
+    to the PDFium-based extractor, which is considerably faster on large
+    documents but may lay out text differently; it falls back to pypdf when
+    not installed. Unknown values log a warning (once per value) and also
+    fall back to pypdf.
+    """
+    raw = os.getenv(_PDF_BACKEND_ENV, "").strip().lower()
+    if raw in {"", "pypdf"}:
+        return "pypdf"
+    if raw in {"pypdfium2", "pdfium"}:
+        return "pypdfium2"
+    if raw not in _WARNED_BACKENDS:
+        _WARNED_BACKENDS.add(raw)
+        log.warning(
+            "Unknown %s value %r; expected 'pypdf' or 'pypdfium2'. Using pypdf.",
+            _PDF_BACKEND_ENV,
+            raw,
+        )
+    return "pypdf"
+
+
+def _safe_extract_text(page: Any) -> str:
+    """Returns a pypdf page's text, or an empty string if extraction fails."""
+    try:
+        return page.extract_text() or ""
+    except Exception:
+        return ""
+
+
+def _extract_pages_pypdf(
+    data: bytes,
+    password: str | None,
+) -> tuple[list[str], dict[str, Any]] | None:
+    """Extracts per-page text and metadata with pypdf.
+
+    Returns:
+        tuple[list[str], dict[str, Any]] | None: Page texts and metadata, or
+        None when the document is encrypted and cannot be decrypted.
+    """
+    reader = PdfReader(BytesIO(data))
+    if reader.is_encrypted:
+        if not password:
+            return None
+        try:
+            reader.decrypt(password)
+        except Exception:
+            return None
+
+    # Try to collect metadata (robust to absence)
+    try:
+        pdf_meta = _collect_pdf_metadata(reader)
+    except Exception:
+        pdf_meta = {}
+
+    pages_text = [_safe_extract_text(p) for p in reader.pages]
+    return pages_text, pdf_meta
+
+
+def _extract_pages_pypdfium2(
+    data: bytes,
+    password: str | None,
+) -> tuple[list[str], dict[str, Any]] | None:
+    """Extracts per-page text and Info metadata with pypdfium2.
+
+    Raises:
+        ImportError: If pypdfium2 is not installed.
+
+    Returns:
+        tuple[list[str], dict[str, Any]] | None: Page texts and metadata, or
+        None when the document is encrypted and cannot be decrypted.
+    """
+    import pypdfium2 as pdfium
+
+    try:
+        pdf = pdfium.PdfDocument(data, password=password)
+    except pdfium.PdfiumError as exc:
+        # Mirror pypdf: skip documents we cannot decrypt, surface anything else.
+        if "password" in str(exc).lower():
+            return None
+        raise
+    try:
+        pdf_meta: dict[str, Any] = {}
+        try:
+            info = pdf.get_metadata_dict(skip_empty=True)
+        except Exception:
+            info = {}
+        for key, name in _PDFIUM_META_KEYS.items():
+            if info.get(key):
+                pdf_meta[name] = info[key]
+        for key, name in _PDFIUM_DATE_KEYS.items():
+            val = _iso8601(info.get(key))
+            if val:
+                pdf_meta[name] = val
+
+        pages_text: list[str] = []
+        for page in pdf:
+            try:
+                textpage = page.get_textpage()
+                try:
+                    txt = textpage.get_text_bounded() or ""
+                finally:
+                    textpage.close()
+            except Exception:
+                txt = ""
+            finally:
+                page.close()
+            pages_text.append(txt)
+        return pages_text, pdf_meta
+    finally:
+        pdf.close()
+
+
+def _extract_pages(
+    data: bytes,
+    password: str | None,
+) -> tuple[list[str], dict[str, Any]] | None:
+    """Dispatches page extraction to the configured backend."""
+    if _pdf_backend() == "pypdfium2":
+        try:
+            return _extract_pages_pypdfium2(data, password)
+        except ImportError:
+            pass
+    return _extract_pages_pypdf(data, password)
+
+
+def iter_pdf_records(
     data: bytes,
     *,
     rel_path: str,
@@ -165,12 +314,18 @@ def extract_pdf_records(
     license_id: str | None = None,
     password: str | None = None,
     mode: str = "page",  # "page" => 1 record per page; "chunk" => join+chunk
-) -> list[dict[str, object]]:
-    """Converts PDF bytes into Sievio JSONL records with metadata.
+) -> Iterator[dict[str, object]]:
+    """Converts PDF bytes into a lazy iterator of Sievio JSONL records.
+
+    Text is extracted eagerly (so parse errors surface at call time), but
+    records are built one page or chunk at a time as the iterator is
+    consumed, so callers streaming to sinks never hold the full record list.
 
-    This routine is CPU-bound (pypdf parsing, text extraction, and
+    This routine is CPU-bound (PDF parsing, text extraction, and
     chunking). For large batches, configure the pipeline to use process
-    execution so PDF-heavy workloads can be parallelized.
+    execution so PDF-heavy workloads can be parallelized. Set
+    ``SIEVIO_PDF_BACKEND=pypdfium2`` to extract text with PDFium instead of
+    pypdf when it is installed.
 
     Args:
         data (bytes): Raw PDF content.
@@ -184,10 +339,9 @@ def extract_pdf_records(
             chunk the entire document.
 
     Returns:
-        List[Dict[str, object]]: Extracted records with text and metadata.
+        Iterator[Dict[str, object]]: Extracted records with text and metadata.
     """
     policy = policy or ChunkPolicy(mode="doc")
-    reader = PdfReader(BytesIO(data))
     ctx = RepoContext(
         repo_full_name=repo_full_name,
         repo_url=repo_url,
@@ -204,38 +358,19 @@ def extract_pdf_records(
             return merged
         return extra
 
-    if reader.is_encrypted:
-        if not password:
-            return []
-        try:
-            reader.decrypt(password)
-        except Exception:
-            return []
-
-    # Try to collect metadata (robust to absence)
-    try:
-        pdf_meta = _collect_pdf_metadata(reader)
-    except Exception:
-        pdf_meta = {}
-
+    extracted = _extract_pages(data, password)
+    if extracted is None:
+        return iter(())
+    pages_text, pdf_meta = extracted
     file_bytes = len(data)
 
-    # Extract text per page
-    pages_text: list[str] = []
-    for p in reader.pages:
-        try:
-            txt = p.extract_text() or ""
-        except Exception:
-            txt = ""
-        pages_text.append(txt)
     file_nlines = sum((t.count("\n") + 1 if t else 0) for t in pages_text) if pages_text else 0
 
-    records: list[dict[str, object]] = []
-    if mode == "page":
-        n = len(pages_text)
-        for i, text in enumerate(pages_text, start=1):
-            records.append(
-                build_record(
+    def _iter() -> Iterator[dict[str, object]]:
+        if mode == "page":
+            n = len(pages_text)
+            for i, text in enumerate(pages_text, start=1):
+                yield build_record(
                     text=text,
                     rel_path=rel_path,
                     repo_full_name=repo_full_name,
@@ -257,14 +392,14 @@ def extract_pdf_records(
                     file_nlines=file_nlines,
                     file_bytes=file_bytes,
                 )
-            )
-    else:
-        all_text = "\n\n".join(pages_text)
-        chunks = chunk_text(all_text, mode="doc", fmt="text", policy=policy)
-        n = len(chunks)
-        for i, ch in enumerate(chunks, start=1):
-            records.append(
-                build_record(
+        else:
+            all_text = _PAGE_SEP.join(pages_text)
+            # The joined text is all chunking needs; drop the per-page copies.
+            pages_text.clear()
+            chunks = chunk_text(all_text, mode="doc", fmt="text", policy=policy)
+            n = len(chunks)
+            for i, ch in enumerate(chunks, start=1):
+                yield build_record(
                     text=ch["text"],
                     rel_path=rel_path,
                     repo_full_name=repo_full_name,
@@ -281,9 +416,40 @@ def extract_pdf_records(
                     file_nlines=file_nlines,
                     file_bytes=file_bytes,
                 )
-            )
 
-    return records
+    return _iter()
+
+def extract_pdf_records(
+    data: bytes,
+    *,
+    rel_path: str,
+    policy: ChunkPolicy | None = None,
+    repo_full_name: str | None = None,
+    repo_url: str | None = None,
+    license_id: str | None = None,
+    password: str | None = None,
+    mode: str = "page",
+) -> list[dict[str, object]]:
+    """Converts PDF bytes into Sievio JSONL records with metadata.
+
+    Eager wrapper around :func:`iter_pdf_records`; see it for argument
+    details.
+
+    Returns:
+        List[Dict[str, object]]: Extracted records with text and metadata.
+    """
+    return list(
+        iter_pdf_records(
+            data,
+            rel_path=rel_path,
+            policy=policy,
+            repo_full_name=repo_full_name,
+            repo_url=repo_url,
+            license_id=license_id,
+            password=password,
+            mode=mode,
+        )
+    )
 
 # Register default bytes handler
 try:
@@ -27,6 +27,7 @@ __all__ = ["WebPdfListSource", "WebPagePdfSource"]
 _USER_AGENT = "sievio/0.1 (+https://github.com/jochiraider/sievio)"
 _CHUNK = 1024 * 1024  # 1 MiB
 _ALLOWED_SCHEMES = {"http", "https"}
+_UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9._+-]")
 
 
 @dataclass(frozen=True)
@@ -65,7 +66,7 @@ def _sanitize_name(name: str, fallback: str = "document.pdf") -> str:
     base = unquote(base)
     base = base.replace("\\", "/").split("/")[-1]
     # Force a conservative character set
-    base = re.sub(r"[^A-Za-z0-9._+-]", "_", base)
+    base = _UNSAFE_NAME_CHARS.sub("_", base)
     # Avoid empty/hidden
     if not base or base in {".", ".."}:
         base = fallback
@@ -88,7 +89,7 @@ def _filename_from_content_disposition(hval: str | None) -> str | None:
     Returns:
         str | None: Filename or None if not present.
     """
-    if not hval:
+    if not hval or "filename" not in hval.lower():
         return None
     m = _CDISP_RE.search(hval)
     if not m:
@@ -239,9 +240,8 @@ class WebPdfListSource(Source):
                         # If bad header, ignore and rely on streaming cap
                         pass
 
-                # Stream with cap; also capture a small head for sniffing
+                # Stream with cap; sniff the first chunk for a PDF signature
                 buf = io.BytesIO()
-                head = b""
                 first = True
                 remaining = self.max_pdf_bytes
                 while True:
@@ -252,8 +252,16 @@ class WebPdfListSource(Source):
                     if not chunk:
                         break
                     if first:
-                        head = chunk[:8]
                         first = False
+                        if (
+                            self.require_pdf
+                            and len(chunk) >= 5
+                            and not _looks_like_pdf(chunk[:8])
+                        ):
+                            # Mislabeled link (HTML error page etc.): keep only the head so
+                            # the caller skips it without pulling the rest of the body.
+                            buf.write(chunk)
+                            break
                     buf.write(chunk)
                     remaining -= len(chunk)
                 data = buf.getvalue()
@@ -262,8 +270,6 @@ class WebPdfListSource(Source):
                 if len(data) > self.max_pdf_bytes:
                     # If we exactly hit the cap, treat as too large (likely truncated)
                     raise RuntimeError("download reached size cap (truncated)")
-                # Attach a small sniff header in case the caller wants it
-                headers["_X-SNIFF"] = head[:8].hex()
                 declared = headers.get("Content-Length")
                 original_size = len(data)
                 if declared is not None:
@@ -299,7 +305,7 @@ class WebPdfListSource(Source):
         url: str,
         data: bytes,
         headers: dict[str, str],
-        used_names: set[str],
+        used_names: dict[str, int],
         file_bytes: int,
     ) -> FileItem | None:
         """Builds a FileItem from downloaded PDF content."""
@@ -308,17 +314,13 @@ class WebPdfListSource(Source):
         if not name.lower().endswith(".pdf"):
             name = f"{name}.pdf"
 
-        sniff_head = (
-            bytes.fromhex(headers.get("_X-SNIFF", ""))
-            if headers.get("_X-SNIFF")
-            else data[:8]
-        )
-        if self.require_pdf and not _looks_like_pdf(sniff_head):
-            if not _looks_like_pdf(data[:8]):
-                return None
+        if self.require_pdf and not _looks_like_pdf(data[:8]):
+            return None
 
+        # used_names maps every taken name to the next suffix to probe for it,
+        # so repeated stems resume where the previous collision left off.
         orig = name
-        n = 1
+        n = used_names.get(orig, 1)
         while name in used_names:
             stem, dot, ext = orig.rpartition(".")
             if stem:
@@ -326,7 +328,8 @@ class WebPdfListSource(Source):
             else:
                 name = f"{orig}__{n}"
             n += 1
-        used_names.add(name)
+        used_names.setdefault(name, 1)
+        used_names[orig] = n
 
         if self.add_prefix:
             name = f"{self.add_prefix}/{name}"
@@ -342,7 +345,7 @@ class WebPdfListSource(Source):
 
     def iter_files(self) -> Iterable[FileItem]:
         """Yields downloaded PDFs as FileItem objects."""
-        used_names: set[str] = set()
+        used_names: dict[str, int] = {}
         total_urls = len(self.urls)
         success_count = 0
         skipped_count = 0
@@ -451,6 +454,9 @@ class WebPdfListSource(Source):
 #  WebPagePdfSource
 # ----------------------------
 
+_HREF_TAGS = frozenset({"a", "area", "link", "base"})
+
+
 class _PdfLinkScraper(HTMLParser):
     """Tiny link scraper to collect PDF hrefs and <base href> (if present)."""
     def __init__(self) -> None:
@@ -459,14 +465,20 @@ class _PdfLinkScraper(HTMLParser):
         self.base_href: str | None = None
 
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        at = dict(attrs)
-        if tag.lower() == "base" and "href" in at and at["href"]:
-            self.base_href = at["href"]
+        # HTMLParser lowercases tag and attribute names; skip other tags before
+        # touching attrs. The last href wins, as it would in a dict of attrs.
+        if tag not in _HREF_TAGS:
             return
-        if tag.lower() in ("a", "area", "link"):
-            href = at.get("href")
-            if href:
-                self.links.append(href)
+        href = None
+        for name, value in attrs:
+            if name == "href":
+                href = value
+        if not href:
+            return
+        if tag == "base":
+            self.base_href = href
+        else:
+            self.links.append(href)
 
 
 class WebPagePdfSource(Source):
@@ -81,3 +81,66 @@ def test_count_tokens_falls_back_without_tokenizer(monkeypatch) -> None:
     assert n2 > 0
     if n1 > 0:
         assert abs(n2 - n1) <= max(1, int(n1 * 0.5))
+
+
+def test_char_token_ratio_ascii_and_unicode_agree() -> None:
+    ascii_text = "x = f(1, 2) + y[3]  # 42\n"
+    # Same punctuation/digit/space mix with a non-ASCII letter swapped in.
+    unicode_text = ascii_text.replace("y", "é")
+
+    for kind in ("code", "doc"):
+        assert chunk_module._char_token_ratio(ascii_text, kind) == (
+            chunk_module._char_token_ratio(unicode_text, kind)
+        )
+    assert chunk_module._char_token_ratio("", "code") == 4.0
+
+
+def test_split_markdown_blocks_heading_detection() -> None:
+    text = "# Title\nbody\n   ### Indented\n    # not a heading\n#hashtag\n"
+
+    blocks = chunk_module._split_markdown_blocks(text, None)
+
+    assert [(b.kind, b.text) for b in blocks] == [
+        ("heading", "# Title\n"),
+        ("text", "body\n"),
+        ("heading", "   ### Indented\n"),
+        ("text", "    # not a heading\n#hashtag\n"),
+    ]
+    assert "".join(b.text for b in blocks) == text
+
+
+def test_iter_packed_blocks_overlap_seeds_next_chunk_with_tail() -> None:
+    blocks = [
+        chunk_module.Block("a" * 40, 0, 40, 10),
+        chunk_module.Block("b" * 40, 40, 80, 10),
+        chunk_module.Block("c" * 40, 80, 120, 10),
+    ]
+
+    chunks = list(
+        chunk_module.iter_packed_blocks(
+            blocks,
+            target_tokens=12,
+            overlap_tokens=2,
+            min_tokens=5,
+            tokenizer=None,
+            mode="doc",
+        )
+    )
+
+    first_text, _, first_end, _ = chunks[0]
+    second_text, second_start, _, _ = chunks[1]
+    tail = second_text[: first_end - second_start]
+    assert tail and first_text.endswith(tail)
+    assert second_text == tail + "b" * 40
+
+
+def test_split_markdown_blocks_fences() -> None:
+    text = "intro\n   ~~~~\ncode ```\n~~~~\n    ```not a fence\nend\n"
+
+    blocks = chunk_module._split_markdown_blocks(text, None)
+
+    assert [(b.kind, b.text) for b in blocks] == [
+        ("text", "intro\n"),
+        ("code", "   ~~~~\ncode ```\n~~~~\n"),
+        ("text", "    ```not a fence\nend\n"),
+    ]
@@ -400,6 +400,45 @@ def test_build_pipeline_plan_registry_wiring(tmp_path: Path):
     assert plan.spec.metadata.primary_jsonl == plan.spec.sinks.primary_jsonl_name
 
 
+def test_build_pipeline_plan_header_only_built_for_accepting_sinks(tmp_path: Path, monkeypatch):
+    cfg = _make_basic_spec(tmp_path)
+    plan = build_pipeline_plan(cfg, mutate=False, load_plugins=False)
+    assert plan.runtime.sinks[0]._header_record is not None
+
+    class HeaderlessSink:
+        def write(self, record):
+            return None
+
+        def close(self):
+            return None
+
+    class HeaderlessSinkFactory:
+        id = "default_jsonl_prompt"
+
+        def build(self, ctx, spec):
+            jsonl_path = str(tmp_path / "headerless.jsonl")
+            return SinkFactoryResult(
+                jsonl_path=jsonl_path,
+                sinks=[HeaderlessSink()],
+                sink_config=ctx.sink_config,
+                metadata={"primary_jsonl": jsonl_path},
+            )
+
+    def fail_header(cfg):
+        raise AssertionError("header should not be built without a receiving sink")
+
+    monkeypatch.setattr("sievio.core.builder.build_run_header_record", fail_header)
+    sink_registry = SinkRegistry()
+    sink_registry.register(HeaderlessSinkFactory())
+    plan = build_pipeline_plan(
+        cfg,
+        mutate=False,
+        sink_registry=sink_registry,
+        load_plugins=False,
+    )
+    assert isinstance(plan.runtime.sinks[0], HeaderlessSink)
+
+
 def test_resolve_executor_config_auto_no_heavy():
     cfg = SievioConfig()
     cfg.pipeline.executor_kind = "auto"
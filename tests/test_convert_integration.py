@@ -26,3 +26,100 @@ def test_extract_pdf_records_real_bytes():
     rec = records[0]
     assert rec["meta"]["rel_path"] == "sample.pdf"
     assert rec["meta"]["file_bytes"] == len(data)
+
+
+def test_extract_pdf_records_pypdfium2_backend(monkeypatch):
+    try:
+        from pypdf import PdfWriter
+    except Exception:
+        pytest.skip("pypdf not available")
+    pytest.importorskip("pypdfium2")
+
+    from sievio.sources.pdfio import extract_pdf_records
+
+    writer = PdfWriter()
+    writer.add_blank_page(width=72, height=72)
+    writer.add_blank_page(width=72, height=72)
+    writer.add_metadata({"/Title": "Sample"})
+    buf = io.BytesIO()
+    writer.write(buf)
+    data = buf.getvalue()
+
+    monkeypatch.setenv("SIEVIO_PDF_BACKEND", "pypdfium2")
+    records = extract_pdf_records(data, rel_path="sample.pdf")
+
+    assert [rec["meta"]["page"] for rec in records] == [1, 2]
+    assert records[0]["meta"]["pdf_meta"]["title"] == "Sample"
+
+
+def _blank_pdf_bytes() -> bytes:
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    writer.add_blank_page(width=72, height=72)
+    buf = io.BytesIO()
+    writer.write(buf)
+    return buf.getvalue()
+
+
+def test_pdf_backend_falls_back_to_pypdf_when_pypdfium2_missing(monkeypatch):
+    pytest.importorskip("pypdf")
+    import builtins
+
+    from sievio.sources import pdfio
+
+    real_import = builtins.__import__
+
+    def _no_pdfium(name, *args, **kwargs):
+        if name == "pypdfium2":
+            raise ImportError("No module named 'pypdfium2'")
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", _no_pdfium)
+    monkeypatch.setenv("SIEVIO_PDF_BACKEND", "pypdfium2")
+    records = pdfio.extract_pdf_records(_blank_pdf_bytes(), rel_path="sample.pdf")
+
+    assert [rec["meta"]["page"] for rec in records] == [1]
+
+
+def test_pdf_backend_unknown_value_warns_and_uses_pypdf(monkeypatch, caplog):
+    pytest.importorskip("pypdf")
+    from sievio.sources import pdfio
+
+    monkeypatch.setattr(pdfio, "_WARNED_BACKENDS", set())
+    monkeypatch.setenv("SIEVIO_PDF_BACKEND", "mupdf")
+    with caplog.at_level("WARNING", logger=pdfio.log.name):
+        records = pdfio.extract_pdf_records(_blank_pdf_bytes(), rel_path="sample.pdf")
+        assert pdfio._pdf_backend() == "pypdf"
+
+    assert [rec["meta"]["page"] for rec in records] == [1]
+    warnings = [r for r in caplog.records if "SIEVIO_PDF_BACKEND" in r.getMessage()]
+    assert len(warnings) == 1
+
+    monkeypatch.setenv("SIEVIO_PDF_BACKEND", "PyPDF")
+    assert pdfio._pdf_backend() == "pypdf"
+
+
+def test_pdfium_backend_skips_undecryptable_and_raises_on_corrupt(monkeypatch):
+    pytest.importorskip("pypdf")
+    import sys
+    import types
+
+    from sievio.sources import pdfio
+
+    class PdfiumError(RuntimeError):
+        pass
+
+    def _open(data, password=None):
+        if data.startswith(b"locked"):
+            raise PdfiumError("Failed to load document (PDFium: Incorrect password error).")
+        raise PdfiumError("Failed to load document (PDFium: Data format error).")
+
+    fake = types.ModuleType("pypdfium2")
+    fake.PdfiumError = PdfiumError
+    fake.PdfDocument = _open
+    monkeypatch.setitem(sys.modules, "pypdfium2", fake)
+
+    assert pdfio._extract_pages_pypdfium2(b"locked", None) is None
+    with pytest.raises(PdfiumError):
+        pdfio._extract_pages_pypdfium2(b"garbage", None)
@@ -1,7 +1,9 @@
+import unicodedata
 from pathlib import Path
 
 from sievio.core.decode import (
     _maybe_repair_cp1252_utf8,
+    _strip_unsafe_controls,
     decode_bytes,
     read_decoded_text,
     read_text,
@@ -99,6 +101,36 @@ def test_decode_normalizes_newlines_and_strips_controls() -> None:
     assert dec.provenance.changed is True
 
 
+def test_strip_unsafe_controls_matches_category_filter() -> None:
+    text = "a\tb\nc\x00\x7f\x85\u00ad\u200b\u200e\ufeff\ue000\U000e0001é\u2028z"
+    expected = "".join(
+        ch
+        for ch in text
+        if ch in "\t\n" or unicodedata.category(ch)[0] != "C"
+    )
+
+    stripped, removed = _strip_unsafe_controls(text)
+
+    assert stripped == expected == "a\tb\ncé\u2028z"
+    assert removed == len(text) - len(expected)
+
+
+def test_decode_ascii_fast_path_matches_full_postprocess() -> None:
+    clean = decode_bytes(b"def f():\n\treturn 1\n")
+    assert clean.text == "def f():\n\treturn 1\n"
+    assert clean.encoding == "utf-8"
+    assert clean.provenance.changed is False
+
+    kept = decode_bytes(b"a\x01b\n", strip_controls=False)
+    assert kept.text == "a\x01b\n"
+    assert kept.provenance.changed is False
+
+    stripped = decode_bytes(b"a\x01b\r\n")
+    assert stripped.text == "ab\n"
+    assert stripped.provenance.controls_stripped == 1
+    assert stripped.provenance.newlines_normalized is True
+
+
 def test_mojibake_repair_accepts_obvious_utf8_misdecode() -> None:
     assert _maybe_repair_cp1252_utf8("FranÃ§ois") == "François"
 
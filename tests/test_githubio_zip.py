@@ -0,0 +1,168 @@
+import io
+import json
+import zipfile
+
+from sievio.cli import runner
+from sievio.core.config import GitHubSourceConfig, SievioConfig
+from sievio.sources import githubio
+from sievio.sources.githubio import GitHubZipSource, iter_zip_members
+
+
+def _write_zip(path, members):
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+
+
+def test_iter_zip_members_name_filter_skips_before_reading(tmp_path, monkeypatch):
+    zip_path = tmp_path / "repo.zip"
+    _write_zip(
+        zip_path,
+        {"repo-main/keep.py": b"x = 1\n", "repo-main/big.bin": b"\0" * 4096},
+    )
+    opened = []
+    real_open = zipfile.ZipFile.open
+
+    def _tracking_open(self, name, *args, **kwargs):
+        opened.append(getattr(name, "filename", name))
+        return real_open(self, name, *args, **kwargs)
+
+    monkeypatch.setattr(zipfile.ZipFile, "open", _tracking_open)
+
+    members = list(
+        iter_zip_members(str(zip_path), name_filter=lambda rel: rel.endswith(".py"))
+    )
+
+    assert [rel for rel, _, _ in members] == ["keep.py"]
+    assert opened == ["repo-main/keep.py"]
+
+
+class _FakeZipResponse:
+    status = 200
+    headers: dict[str, str] = {}
+
+    def __init__(self, payload):
+        self._buf = io.BytesIO(payload)
+
+    def read(self, n=-1):
+        return self._buf.read(n)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _FakeZipClient:
+    def __init__(self, payload):
+        self.payload = payload
+        self.urls = []
+
+    def open_with_retries(self, req, timeout=None, retries=0):
+        self.urls.append(req.full_url)
+        return _FakeZipResponse(self.payload)
+
+
+def _zip_bytes(members):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return buf.getvalue()
+
+
+def test_github_zip_source_downloads_resolved_ref(monkeypatch):
+    def _no_lookup(spec, *, client=None):
+        raise AssertionError("default branch lookup should be skipped")
+
+    monkeypatch.setattr(githubio, "get_repo_info", _no_lookup)
+    client = _FakeZipClient(_zip_bytes({"repo-dev/a.py": b"x = 1\n"}))
+    src = GitHubZipSource(
+        "https://github.com/owner/repo",
+        config=GitHubSourceConfig(),
+        http_client=client,
+        ref="dev",
+    )
+
+    with src:
+        paths = [item.path for item in src.iter_files()]
+
+    assert paths == ["a.py"]
+    assert client.urls == ["https://api.github.com/repos/owner/repo/zipball/dev"]
+
+
+def test_make_github_profile_resolves_ref_once(monkeypatch, tmp_path):
+    calls = []
+
+    def _fake_repo_info(spec, *, client=None):
+        calls.append(spec)
+        return {"default_branch": "dev"}
+
+    monkeypatch.setattr(runner, "get_repo_info", _fake_repo_info)
+    monkeypatch.setattr(runner, "detect_license_for_github_repo", lambda spec, **kw: None)
+
+    cfg = runner.make_github_profile("https://github.com/owner/repo", tmp_path / "out.jsonl")
+
+    assert len(calls) == 1
+    assert cfg.sources.specs[0].options == {"url": "https://github.com/owner/repo", "ref": "dev"}
+
+
+def test_make_github_profile_omits_unresolved_ref(monkeypatch, tmp_path):
+    def _failing_repo_info(spec, *, client=None):
+        raise RuntimeError("rate limited")
+
+    monkeypatch.setattr(runner, "get_repo_info", _failing_repo_info)
+    monkeypatch.setattr(runner, "detect_license_for_github_repo", lambda spec, **kw: None)
+
+    cfg = runner.make_github_profile("https://github.com/owner/repo", tmp_path / "out.jsonl")
+
+    assert cfg.sources.specs[0].options == {"url": "https://github.com/owner/repo"}
+
+
+def test_github_zip_source_reads_given_zip_without_downloading(tmp_path):
+    zip_path = tmp_path / "repo.zip"
+    zip_path.write_bytes(_zip_bytes({"repo-main/a.py": b"x = 1\n"}))
+    client = _FakeZipClient(b"")
+    src = GitHubZipSource(
+        "https://github.com/owner/repo",
+        config=GitHubSourceConfig(),
+        http_client=client,
+    )
+    src.use_existing_zip(str(zip_path))
+
+    with src:
+        paths = [item.path for item in src.iter_files()]
+
+    assert paths == ["a.py"]
+    assert client.urls == []
+    assert zip_path.exists()
+
+
+def test_convert_github_downloads_zipball_once(monkeypatch, tmp_path):
+    downloads = []
+
+    def _fake_download(spec, *, ref=None, client=None, timeout=None, **kwargs):
+        path = tmp_path / f"dl{len(downloads)}.zip"
+        path.write_bytes(_zip_bytes({"repo-main/a.py": b"print('hi')\n"}))
+        downloads.append((spec.full_name, ref, client is not None, timeout))
+        return str(path)
+
+    def _no_download(*args, **kwargs):
+        raise AssertionError("GitHubZipSource should reuse the profile's zipball")
+
+    monkeypatch.setattr(runner, "get_repo_info", lambda spec, *, client=None: {})
+    monkeypatch.setattr(runner, "download_zipball_to_temp", _fake_download)
+    monkeypatch.setattr(githubio, "download_zipball_to_temp", _no_download)
+
+    out = tmp_path / "out.jsonl"
+    base = SievioConfig()
+    base.http.timeout = 7.5
+    stats = runner.convert_github("https://github.com/owner/repo", out, base_config=base)
+
+    assert downloads == [("owner/repo", None, True, 7.5)]
+    assert stats["records"] >= 1
+    assert not (tmp_path / "dl0.zip").exists()
+    assert base.http.client is None
+    header = json.loads(out.read_text(encoding="utf-8").splitlines()[0])
+    assert "zip_path" not in json.dumps(header)
@@ -1,10 +1,11 @@
 import json
 import logging
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
 
-from sievio.core.builder import PipelineOverrides, build_engine, build_pipeline_plan
+from sievio.core.builder import PipelineOverrides, PipelinePlan, build_engine, build_pipeline_plan
 from sievio.core.config import SievioConfig, SinkSpec, SourceSpec
 from sievio.core.interfaces import RepoContext
 from sievio.core.pipeline import MiddlewareError, PipelineEngine, _FuncRecordMiddleware
@@ -38,6 +39,10 @@ def _make_basic_plan(tmp_path: Path, *, fail_fast: bool = False) -> PipelineEngi
     return PipelineEngine(plan)
 
 
+def _with_runtime(plan: PipelinePlan, **changes) -> PipelinePlan:
+    return replace(plan, runtime=replace(plan.runtime, **changes))
+
+
 def _read_payloads(engine: PipelineEngine) -> list[dict]:
     cfg = engine.config
     jsonl_path = cfg.sinks.primary_jsonl_name or cfg.metadata.primary_jsonl
@@ -116,7 +121,7 @@ def test_qc_hook_attaches_record_middleware(tmp_path: Path):
             self.finished = True
 
     hook = TagHook()
-    engine.plan.runtime.lifecycle_hooks = (hook,)
+    engine.plan = _with_runtime(engine.plan, lifecycle_hooks=(hook,))
     # Keep engine's cached hooks in sync with the mutated runtime.
     engine._hooks = (hook,)
 
@@ -142,7 +147,7 @@ def test_sink_open_failure_increments_stats(tmp_path: Path):
         def close(self):
             return None
 
-    engine.plan.runtime.sinks = (FailingSink(),)
+    engine.plan = _with_runtime(engine.plan, sinks=(FailingSink(),))
 
     stats = engine.run()
 
@@ -385,7 +390,7 @@ def test_record_chain_preserves_order_and_writes_once(tmp_path: Path):
     engine.record_filter_hooks.append(allow)
     engine.add_record_middleware(mw)
     engine.after_record_hooks.append(after)
-    engine.plan.runtime.lifecycle_hooks = (hook,)
+    engine.plan = _with_runtime(engine.plan, lifecycle_hooks=(hook,))
     engine._hooks = (hook,)
 
     stats = engine.run()
@@ -438,7 +443,7 @@ def test_record_chain_drops_skip_after_and_lifecycle(tmp_path: Path):
     engine.record_filter_hooks.append(drop)
     engine.add_record_middleware(mw)
     engine.after_record_hooks.append(after)
-    engine.plan.runtime.lifecycle_hooks = (hook,)
+    engine.plan = _with_runtime(engine.plan, lifecycle_hooks=(hook,))
     engine._hooks = (hook,)
 
     stats = engine.run()
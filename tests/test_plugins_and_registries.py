@@ -3,7 +3,11 @@ from types import SimpleNamespace
 
 import pytest
 
-from sievio.core.builder import build_pipeline_plan
+from sievio.core.builder import (
+    _default_registry_bundle,
+    build_pipeline_plan,
+    invalidate_registry_cache,
+)
 from sievio.core.config import SievioConfig, SinkSpec, SourceSpec
 from sievio.core.factories import SinkFactoryResult
 from sievio.core.interfaces import SinkFactoryContext, SourceFactoryContext
@@ -276,3 +280,57 @@ def test_build_pipeline_plan_per_registry_override_wins_over_bundle(monkeypatch,
     assert plan.runtime.sources[0].label == "override"
     assert isinstance(plan.runtime.sinks[0], DummySink)
     assert plan.runtime.sinks[0].name == "bundle"
+
+
+def test_build_pipeline_plan_caches_default_registries(monkeypatch, tmp_path):
+    calls: list[dict] = []
+
+    def fake_loader(**kwargs):
+        calls.append(kwargs)
+
+    monkeypatch.setattr("sievio.core.plugins.load_entrypoint_plugins", fake_loader)
+    invalidate_registry_cache()
+
+    def make_cfg():
+        cfg = SievioConfig()
+        cfg.sinks.specs = (
+            SinkSpec(
+                kind="default_jsonl_prompt",
+                options={"jsonl_path": str(tmp_path / "data.jsonl")},
+            ),
+        )
+        return cfg
+
+    try:
+        build_pipeline_plan(make_cfg(), load_plugins=True)
+        build_pipeline_plan(make_cfg(), load_plugins=True)
+        assert len(calls) == 1
+
+        invalidate_registry_cache()
+        build_pipeline_plan(make_cfg(), load_plugins=True)
+        assert len(calls) == 2
+    finally:
+        invalidate_registry_cache()
+
+
+def test_default_registry_bundle_registrations_do_not_leak(tmp_path):
+    invalidate_registry_cache()
+    try:
+        bundle = _default_registry_bundle(False)
+        bundle.sources.register(DummySourceFactory(label="leaked"))
+        bundle.sinks.register(DummySinkFactory(name="leaked"))
+
+        fresh = _default_registry_bundle(False)
+        assert "dummy_source" not in fresh.sources._factories
+        assert "dummy_sink" not in fresh.sinks._factories
+        assert "local_dir" in fresh.sources._factories
+
+        cfg = SievioConfig()
+        cfg.sources.specs = (SourceSpec(kind="dummy_source", options={}),)
+        cfg.sinks.specs = (
+            SinkSpec(kind="dummy_sink", options={"jsonl_path": str(tmp_path / "x.jsonl")}),
+        )
+        with pytest.raises(ValueError, match="Unknown source kind"):
+            build_pipeline_plan(cfg, load_plugins=False)
+    finally:
+        invalidate_registry_cache()
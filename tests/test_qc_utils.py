@@ -9,6 +9,7 @@ import pytest
 from sievio.core import qc_utils
 from sievio.core.qc_utils import (
     MinHashLSH,
+    code_complexity,
     minhash_signature_for_text,
     parse_ok,
     repetition_rate,
@@ -45,6 +46,25 @@ def test_simhash64_single_token_matches_hash():
     assert simhash64(text) == expected
 
 
+def test_simhash64_column_counts_match_per_bit_reference():
+    rng = random.Random(7)
+    words = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel"]
+    text = " ".join(rng.choice(words) + str(rng.randrange(50)) for _ in range(500))
+
+    def reference(max_tokens):
+        v = [0] * 64
+        for idx, tok in enumerate(qc_utils._tokenize_for_simhash(text)):
+            if idx >= max_tokens:
+                break
+            h = qc_utils._token_hash64(tok)
+            for i in range(64):
+                v[i] += 1 if (h >> i) & 1 else -1
+        return sum(1 << i for i, val in enumerate(v) if val > 0)
+
+    assert qc_utils.simhash64(text) == reference(20000)
+    assert qc_utils.simhash64(text, max_tokens=37) == reference(37)
+
+
 def test_simhash64_non_positive_max_tokens_returns_zero():
     text = "Token"
     assert simhash64(text, max_tokens=0) == 0
@@ -265,3 +285,10 @@ def test_perplexity_overflow_returns_inf(monkeypatch):
     model.max_len = 4
     model.stride = 2
     assert model.ppl("hello") == float("inf")
+
+
+def test_code_complexity_counts_punctuation_and_short_lines():
+    text = "if (a) {\n  b[0] = c;\n}\n"
+    expected = 0.5 * (8 / len(text)) + 0.5 * (3 / 3)
+    assert code_complexity(text) == pytest.approx(expected)
+    assert code_complexity("") == 0.0
@@ -151,3 +151,28 @@ def test_accel_minhash_deterministic_under_threads(monkeypatch):
 
     expected = qc_utils.minhash_signature_for_text(text, k=k, n_perm=n_perm)
     assert all(sig == expected for sig in results)
+
+
+_BATCH_TEXTS = ["", "Token", " \n\t", "abcdefg " * 200, "éé unicode tokens", "short"]
+
+
+def test_accel_simhash64_batch_matches_single():
+    from sievio_accel import qc as accel_qc
+
+    for max_tokens in (None, 3):
+        expected = [accel_qc.simhash64(t, max_tokens=max_tokens) for t in _BATCH_TEXTS]
+        assert accel_qc.simhash64_batch(_BATCH_TEXTS, max_tokens=max_tokens) == expected
+
+
+def test_accel_minhash_batch_matches_single():
+    from sievio_accel import qc as accel_qc
+
+    for max_shingles in (None, 16):
+        expected = [
+            accel_qc.minhash_signature_for_text(t, k=5, n_perm=64, max_shingles=max_shingles)
+            for t in _BATCH_TEXTS
+        ]
+        got = accel_qc.minhash_signatures_batch(
+            _BATCH_TEXTS, k=5, n_perm=64, max_shingles=max_shingles
+        )
+        assert got == expected
@@ -1,3 +1,5 @@
+import hashlib
+
 from sievio.core.chunk import count_tokens
 from sievio.core.records import (
     build_record,
@@ -5,6 +7,7 @@ from sievio.core.records import (
     filter_qc_meta,
     is_summary_record,
     merge_meta_defaults,
+    sha256_text,
 )
 
 
@@ -46,6 +49,15 @@ def test_build_record_sets_bytes_and_tokens() -> None:
     assert meta["approx_tokens"] == count_tokens(text, None, "doc")
 
 
+def test_build_record_sha256_matches_for_short_and_long_text() -> None:
+    for text in ("", "héllo wörld", "x = 1\n" * 2000):
+        expected = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        record = build_record(text=text, rel_path="a.py")
+        assert record["meta"]["sha256"] == expected
+        assert sha256_text(text) == expected
+        assert sha256_text(text.encode("utf-8")) == expected
+
+
 def test_build_record_propagates_metadata() -> None:
     record = build_record(
         text="content",
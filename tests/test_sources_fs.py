@@ -257,3 +257,17 @@ def test_local_dir_source_skips_special_files(tmp_path):
     src = LocalDirSource(repo, config=LocalDirSourceConfig())
     items = list(src.iter_files())
     assert items == []
+
+
+def test_pattern_source_filters_hidden_and_extensions(tmp_path):
+    repo = tmp_path / "repo"
+    (repo / "pkg").mkdir(parents=True)
+    (repo / ".cache").mkdir()
+    (repo / "pkg" / "keep.py").write_text("x = 1\n")
+    (repo / "pkg" / "skip.TXT").write_text("skip\n")
+    (repo / ".cache" / "hidden.py").write_text("x = 2\n")
+
+    cfg = LocalDirSourceConfig(include_exts={".py", ".txt"}, exclude_exts={".txt"})
+    src = PatternFileSource(repo, ["**/*"], config=cfg)
+
+    assert [item.path for item in src.iter_files()] == ["pkg/keep.py"]
@@ -0,0 +1,81 @@
+import io
+
+from sievio.sources import sources_webpdf
+from sievio.sources.sources_webpdf import WebPdfListSource
+
+
+class _FakeResponse:
+    def __init__(self, body: bytes, headers: dict[str, str] | None = None) -> None:
+        self._body = io.BytesIO(body)
+        self.status = 200
+        self.reason = "OK"
+        self.headers = headers or {}
+        self.reads = 0
+
+    def read(self, n: int = -1) -> bytes:
+        self.reads += 1
+        return self._body.read(n)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+class _FakeClient:
+    def __init__(self, responses: dict[str, _FakeResponse]) -> None:
+        self.responses = responses
+
+    def open_with_retries(self, req, **kwargs):
+        return self.responses[req.full_url]
+
+
+def test_download_stops_after_first_chunk_for_non_pdf():
+    html = _FakeResponse(b"<html>" + b"x" * (3 * 1024 * 1024))
+    pdf = _FakeResponse(b"%PDF-1.7\n" + b"y" * (3 * 1024 * 1024))
+    client = _FakeClient({"https://a.test/x.pdf": html, "https://a.test/y.pdf": pdf})
+    src = WebPdfListSource(["https://a.test/x.pdf"], client=client)
+
+    items = list(src.iter_files())
+
+    assert items == []
+    assert html.reads == 1
+
+    src = WebPdfListSource(["https://a.test/y.pdf"], client=client)
+    items = list(src.iter_files())
+    assert [item.path for item in items] == ["y.pdf"]
+    assert items[0].data.startswith(b"%PDF-")
+
+
+def test_filename_from_content_disposition():
+    parse = sources_webpdf._filename_from_content_disposition
+    assert parse(None) is None
+    assert parse("inline") is None
+    assert parse('attachment; FILENAME="paper.pdf"') == "paper.pdf"
+    assert parse("attachment; filename*=utf-8''r%C3%A9sum%C3%A9.pdf") == "résumé.pdf"
+
+
+def test_build_file_item_dedups_repeated_names():
+    src = WebPdfListSource([], client=_FakeClient({}))
+    used: dict[str, int] = {}
+    urls = [
+        "https://a.test/p/paper.pdf",
+        "https://a.test/q/paper.pdf",
+        "https://a.test/paper__2.pdf",
+        "https://a.test/r/paper.pdf",
+    ]
+    names = [
+        src._build_file_item(u, b"%PDF-1.7\n", {}, used, 9).path for u in urls
+    ]
+    assert names == ["paper.pdf", "paper__1.pdf", "paper__2.pdf", "paper__3.pdf"]
+
+
+def test_pdf_link_scraper_collects_hrefs_and_base():
+    scraper = sources_webpdf._PdfLinkScraper()
+    scraper.feed(
+        '<HTML><BASE HREF="https://a.test/docs/"><div href="x.pdf"></div>'
+        '<a class="pdf" HREF="one.pdf">1</a><area href=""><link href="two.pdf"></HTML>'
+    )
+    assert scraper.base_href == "https://a.test/docs/"
+    assert scraper.links == ["one.pdf", "two.pdf"]